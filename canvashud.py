@@ -0,0 +1,101 @@
+import warnings
+
+class CanvasHud:
+    def __init__(self, canvas):
+        """Keep named text and shape items on a canvas and update them in place."""
+        self.canvas = canvas
+        self.items = {}  # Name -> canvas item
+
+    def text(self, name, x, y, text, **options):
+        """Show a text item, creating it the first time and reusing it afterwards."""
+        item = self.items.get(name)
+        if item is None:
+            self.items[name] = self.canvas.create_text(x, y, text=text, tags="hud", **options)
+        else:
+            self.canvas.coords(item, x, y)
+            self.canvas.itemconfig(item, text=text, state="normal", **options)
+
+    def shape(self, name, kind, coords, **options):
+        """Show a rectangle, oval or line item, creating it the first time and moving it afterwards."""
+        item = self.items.get(name)
+        if item is None:
+            create = getattr(self.canvas, "create_" + kind)
+            self.items[name] = create(*coords, tags="hud", **options)
+        else:
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfig(item, state="normal", **options)
+
+    def hide(self, name):
+        """Hide an item without deleting it."""
+        if name in self.items:
+            self.canvas.itemconfig(self.items[name], state="hidden")
+
+    def raise_above(self):
+        """Keep the HUD on top of items created after it."""
+        self.canvas.tag_raise("hud")
+
+    def __len__(self):
+        return len(self.items)
+
+class ItemPool:
+    def __init__(self, canvas, kind, **options):
+        """Reuse hidden canvas items of one kind instead of deleting and creating them."""
+        self.canvas = canvas
+        self.create = getattr(canvas, "create_" + kind)
+        self.options = options
+        self.free = []  # Hidden items ready to be reused
+        self.size = 0  # Every item the pool owns, shown or hidden
+
+    def acquire(self, *coords):
+        """Return a visible item at the given coordinates."""
+        if self.free:
+            item = self.free.pop()
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfig(item, state="normal")
+            return item
+        self.size += 1
+        return self.create(*coords, **self.options)
+
+    def release(self, item):
+        """Hide an item and keep it for later."""
+        self.canvas.itemconfig(item, state="hidden")
+        self.free.append(item)
+
+    def __len__(self):
+        return self.size
+
+class CanvasItemMonitor:
+    def __init__(self, canvas, name, expected, tolerance=10, on_report=None):
+        """Compare a canvas's live item count with the count its owner expects."""
+        # expected() returns how many items should exist; on_report(live, expected) is
+        # called on every check, for logging or an on-screen counter
+        self.canvas = canvas
+        self.name = name
+        self.expected = expected
+        self.tolerance = tolerance
+        self.on_report = on_report
+        self.warned_at = None  # Live count at the last warning, so a leak is reported once per growth
+
+    def live_count(self):
+        """Return the number of items on the canvas."""
+        return len(self.canvas.find_all())
+
+    def check(self):
+        """Warn when more items exist than expected and return (live, expected)."""
+        live = self.live_count()
+        expected = self.expected()
+        if self.on_report:
+            self.on_report(live, expected)
+        if live > expected + self.tolerance and (self.warned_at is None or live > self.warned_at + self.tolerance):
+            self.warned_at = live
+            warnings.warn(f"{self.name} canvas has {live} items, {live - expected} more than expected; "
+                          "items are leaking", RuntimeWarning)
+        return live, expected
+
+    def start(self, root, interval_ms=5000):
+        """Check the canvas periodically while the window is open."""
+        def run():
+            if root.winfo_exists():
+                self.check()
+                root.after(interval_ms, run)
+        root.after(interval_ms, run)
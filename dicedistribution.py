@@ -0,0 +1,89 @@
+import argparse
+import functools
+
+import numpy as np
+
+# Sums with more outcomes than this use one FFT instead of repeated direct convolution
+FFT_THRESHOLD = 2048
+# win_probabilities refuses to span more final scores than this
+MAX_SUPPORT = 1 << 16
+
+@functools.lru_cache(maxsize=256)
+def sum_distribution(num_dice, sides):
+    """Return the probability of each total of NdM as an array indexed from num_dice."""
+    # The array is shared between callers, so it is made read-only
+    outcomes = num_dice * (sides - 1) + 1
+    if num_dice == 0:
+        pmf = np.ones(1)
+    elif outcomes <= FFT_THRESHOLD:
+        pmf = np.ones(1)
+        die = np.full(sides, 1.0 / sides)
+        power = num_dice
+        # Square-and-multiply on the single-die distribution
+        while power:
+            if power & 1:
+                pmf = np.convolve(pmf, die)
+            power >>= 1
+            if power:
+                die = np.convolve(die, die)
+    else:
+        size = 1 << (outcomes - 1).bit_length()
+        spectrum = np.fft.rfft(np.full(sides, 1.0 / sides), size) ** num_dice
+        pmf = np.clip(np.fft.irfft(spectrum, size)[:outcomes], 0.0, None)
+        pmf /= pmf.sum()
+    pmf.flags.writeable = False
+    return pmf
+
+def outcome_odds(num_dice, sides, total):
+    """Return (chance of exactly total, chance of total or more) for NdM."""
+    pmf = sum_distribution(num_dice, sides)
+    index = total - num_dice
+    if not 0 <= index < len(pmf):
+        return 0.0, float(index < 0)
+    return float(pmf[index]), float(pmf[index:].sum())
+
+def win_probabilities(scores, dice_left, sides):
+    """Return each player's chance of ending with the top score (ties count for every tied player)."""
+    # Final score i is scores[i] plus the sum of dice_left[i] more dice, independent of the others
+    lows = [score + dice for score, dice in zip(scores, dice_left)]
+    highs = [score + dice * sides for score, dice in zip(scores, dice_left)]
+    # A player whose worst final score beats everyone else's best has already won
+    for i, low in enumerate(lows):
+        if all(low > high for j, high in enumerate(highs) if j != i):
+            return [float(j == i) for j in range(len(scores))]
+
+    # No final score below the best worst case can win, so everything under it shares
+    # column 0 and the arrays only span the scores still in contention
+    floor = max(lows)
+    width = max(highs) - floor + 2
+    if width > MAX_SUPPORT:
+        raise ValueError(f"{width} final scores are still in contention, over the {MAX_SUPPORT} limit")
+    pmfs = np.zeros((len(scores), width))
+    for i, dice in enumerate(dice_left):
+        pmf = sum_distribution(dice, sides)
+        start = lows[i] - floor + 1
+        if start < 1:
+            pmfs[i, 0] = pmf[:1 - start].sum()
+            pmf = pmf[1 - start:]
+            start = 1
+        pmfs[i, start:start + len(pmf)] = pmf
+    cdfs = np.cumsum(pmfs, axis=1)
+    chances = []
+    for i in range(len(scores)):
+        others = np.prod(np.delete(cdfs, i, axis=0), axis=0)
+        chances.append(float(pmfs[i, 1:] @ others[1:]))
+    return chances
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exact distribution of the sum of N M-sided dice")
+    parser.add_argument("dice", type=int, help="number of dice")
+    parser.add_argument("--sides", type=int, default=6)
+    args = parser.parse_args()
+
+    pmf = sum_distribution(args.dice, args.sides)
+    mean = args.dice * (args.sides + 1) / 2
+    print(f"{args.dice}d{args.sides}: {len(pmf)} totals, mean {mean:g}, "
+          f"most likely {int(np.argmax(pmf)) + args.dice} ({pmf.max():.4%})")
+    if len(pmf) <= 40:
+        for index, chance in enumerate(pmf):
+            print(f"{index + args.dice:4d}: {chance:8.4%} {'#' * round(chance * 200)}")
@@ -0,0 +1,199 @@
+import argparse
+import functools
+import random
+import re
+import time
+
+# Bulk rolls use NumPy when it is installed and fall back to a list of ints
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Notation: terms joined by + and -, each a whole number or NdM followed by modifiers:
+#   kN / khN keep the N highest dice, klN keep the N lowest, dhN / dlN drop them instead
+#   rN       reroll each die showing N or less, once
+#   !        explode: a die showing its top face rolls again and adds on, repeatedly
+# For example 4d6kh3+2, d20, 2d10!-1, 3d6r1
+TERM = re.compile(r"\s*([+-])?\s*(?:(\d*)d(\d+)((?:k[hl]?\d+|d[hl]\d+|r\d+|!)*)|(\d+))\s*", re.IGNORECASE)
+MODIFIER = re.compile(r"(k[hl]?|d[hl]|r)(\d+)|(!)", re.IGNORECASE)
+
+MAX_DICE = 1000
+MAX_SIDES = 1000000
+MAX_EXPLOSIONS = 100  # Per die, so a roll always ends
+
+class DiceTerm:
+    def __init__(self, count, sides, keep=None, reroll=0, explode=False):
+        """NdM with optional keep/drop, reroll-once and exploding dice."""
+        # keep is (number of dice, "h" or "l") for the dice that count, or None for all
+        if not 1 <= count <= MAX_DICE:
+            raise ValueError(f"Dice count must be between 1 and {MAX_DICE}")
+        if sides > MAX_SIDES:
+            raise ValueError(f"Dice can have at most {MAX_SIDES} sides")
+        if sides < 1 or (explode and sides < 2):
+            raise ValueError(f"A d{sides} cannot be rolled{' with !' if explode else ''}")
+        if reroll >= sides:
+            raise ValueError(f"Rerolling {reroll} or less on a d{sides} never stops")
+        self.count = count
+        self.sides = sides
+        self.keep = keep
+        self.reroll = reroll
+        self.explode = explode
+
+    def roll_dice(self, rng):
+        """Roll the dice with random.Random rng and return every die's final value."""
+        dice = []
+        for _ in range(self.count):
+            value = rng.randint(1, self.sides)
+            if value <= self.reroll:
+                value = rng.randint(1, self.sides)
+            face = value
+            explosions = 0
+            while self.explode and face == self.sides and explosions < MAX_EXPLOSIONS:
+                face = rng.randint(1, self.sides)
+                value += face
+                explosions += 1
+            dice.append(value)
+        return dice
+
+    def kept(self, dice):
+        """Return the dice that count towards the total."""
+        if self.keep is None:
+            return dice
+        number, end = self.keep
+        ordered = sorted(dice)
+        return ordered[len(ordered) - number:] if end == "h" else ordered[:number]
+
+    def roll_many(self, n, generator):
+        """Roll n times with a NumPy Generator and return the n totals."""
+        dice = generator.integers(1, self.sides + 1, size=(n, self.count))
+        if self.reroll:
+            low = dice <= self.reroll
+            dice[low] = generator.integers(1, self.sides + 1, size=int(low.sum()))
+        if self.explode:
+            live = dice == self.sides
+            for _ in range(MAX_EXPLOSIONS):
+                if not live.any():
+                    break
+                faces = generator.integers(1, self.sides + 1, size=int(live.sum()))
+                dice[live] += faces
+                live[live] = faces == self.sides
+        if self.keep is not None:
+            number, end = self.keep
+            dice = np.sort(dice, axis=1)
+            dice = dice[:, self.count - number:] if end == "h" else dice[:, :number]
+        return dice.sum(axis=1)
+
+class DiceExpression:
+    def __init__(self, notation, terms):
+        """A compiled expression: a list of (sign, DiceTerm or constant)."""
+        self.notation = notation
+        self.terms = terms
+
+    def roll(self, rng=random):
+        """Roll once and return the total."""
+        return self.roll_detailed(rng)[0]
+
+    def roll_detailed(self, rng=random):
+        """Roll once and return (total, every die rolled for each dice term)."""
+        total = 0
+        dice_rolled = []
+        for sign, term in self.terms:
+            if isinstance(term, int):
+                total += sign * term
+            else:
+                dice = term.roll_dice(rng)
+                dice_rolled.append(dice)
+                total += sign * sum(term.kept(dice))
+        return total, dice_rolled
+
+    def roll_many(self, n, seed=None):
+        """Roll n times and return the totals, as a NumPy array when NumPy is installed."""
+        if np is None:
+            rng = random.Random(seed)
+            return [self.roll(rng) for _ in range(n)]
+        generator = np.random.default_rng(seed)
+        totals = np.zeros(n, dtype=np.int64)
+        for sign, term in self.terms:
+            totals += sign * (term if isinstance(term, int) else term.roll_many(n, generator))
+        return totals
+
+    def plain_dice(self):
+        """Return (count, sides) if the expression is a single unmodified NdM, else None."""
+        if len(self.terms) == 1 and self.terms[0][0] == 1 and isinstance(self.terms[0][1], DiceTerm):
+            term = self.terms[0][1]
+            if term.keep is None and not term.reroll and not term.explode:
+                return term.count, term.sides
+        return None
+
+    def __repr__(self):
+        return f"DiceExpression({self.notation!r})"
+
+def parse_modifiers(text, count):
+    """Return (keep, reroll, explode) from a term's modifier string."""
+    keep = None
+    reroll = 0
+    explode = False
+    for kind, number, bang in MODIFIER.findall(text):
+        if bang:
+            explode = True
+            continue
+        kind = kind.lower()
+        number = int(number)
+        if kind == "r":
+            reroll = number
+            continue
+        if keep is not None:
+            raise ValueError("Only one keep or drop per dice term")
+        if kind.startswith("k"):
+            keep = (number, "l" if kind == "kl" else "h")
+        else:
+            # Dropping the N lowest keeps the rest of the highest, and vice versa
+            keep = (count - number, "h" if kind == "dl" else "l")
+        if not 0 <= keep[0] <= count:
+            raise ValueError(f"Cannot keep or drop {number} of {count} dice")
+    return keep, reroll, explode
+
+@functools.lru_cache(maxsize=256)
+def compile_notation(notation):
+    """Parse dice notation such as 4d6kh3+2 into a reusable DiceExpression; raises ValueError."""
+    terms = []
+    pos = 0
+    text = notation.strip()
+    if not text:
+        raise ValueError("Empty dice expression")
+    while pos < len(text):
+        match = TERM.match(text, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Cannot read {text!r} at position {pos + 1}")
+        sign_text, count, sides, modifiers, constant = match.groups()
+        if sign_text is None and terms:
+            raise ValueError(f"Expected + or - at position {match.start() + 1}")
+        sign = -1 if sign_text == "-" else 1
+        if constant is not None:
+            terms.append((sign, int(constant)))
+        else:
+            count = int(count) if count else 1
+            keep, reroll, explode = parse_modifiers(modifiers, count)
+            terms.append((sign, DiceTerm(count, int(sides), keep, reroll, explode)))
+        pos = match.end()
+    return DiceExpression(text, terms)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roll dice notation such as 4d6kh3+2")
+    parser.add_argument("notation")
+    parser.add_argument("--rolls", type=int, default=1, help="roll this many times in bulk")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    expression = compile_notation(args.notation)
+    if args.rolls == 1:
+        total, dice = expression.roll_detailed(random.Random(args.seed))
+        print(f"{expression.notation}: {total}  {dice}")
+    else:
+        start = time.perf_counter()
+        totals = expression.roll_many(args.rolls, args.seed)
+        elapsed = time.perf_counter() - start
+        mean = float(totals.mean()) if np is not None else sum(totals) / args.rolls
+        print(f"{args.rolls:,} rolls of {expression.notation}: mean {mean:.3f}, "
+              f"min {min(totals)}, max {max(totals)} in {elapsed:.3f}s")
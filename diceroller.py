@@ -1,102 +1,261 @@
-import random
 import tkinter as tk
 from tkinter import messagebox
+import time
+
+from canvashud import CanvasHud
+from dicenotation import compile_notation
+from dicerollerengine import DiceRollerEngine, DiceTournament
+from gameloop import Histogram
+
+# The exact odds need NumPy; the game runs without them if it is missing
+try:
+    import dicedistribution
+except ImportError:
+    dicedistribution = None
+
+MAX_DICE = 3
+MAX_TOURNAMENT_PLAYERS = 10000
+MAX_TOURNAMENT_ROUNDS = 50
+# Rolls with more possible totals than this show no odds, to bound the distribution's size
+MAX_ODDS_OUTCOMES = 1 << 16
+
+# Menu metadata, read by the game registry without importing this module
+GAME_INFO = {"title": "Dice Roller", "class": "DiceRollerGame"}
+
+class LeaderboardView:
+    def __init__(self, master, rows=20, row_height=22, width=380):
+        """A scrollable leaderboard that only draws the rows in view."""
+        # The canvas holds one persistent text item per visible row; scrolling just
+        # changes their text, so thousands of players cost the same as twenty
+        self.rows = rows
+        self.row_height = row_height
+        self.leaderboard = None
+        self.offset = 0
+        self.cached = (None, [])  # (leaderboard version, top rows fetched for it)
+
+        self.frame = tk.Frame(master)
+        self.canvas = tk.Canvas(self.frame, width=width, height=rows * row_height, bg="white")
+        self.scrollbar = tk.Scrollbar(self.frame, command=self.scroll)
+        self.canvas.pack(side=tk.LEFT)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.hud = CanvasHud(self.canvas)
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units"))
+
+    def show(self, leaderboard):
+        """Show a leaderboard from the top."""
+        self.leaderboard = leaderboard
+        self.offset = 0
+        self.cached = (None, [])
+        self.redraw()
+
+    def scroll(self, action, amount, unit=None):
+        """Handle the scrollbar's moveto and scroll commands."""
+        total = len(self.leaderboard) if self.leaderboard else 0
+        if action == "moveto":
+            self.offset = int(float(amount) * total)
+        else:
+            self.offset += int(amount) * (self.rows if unit == "pages" else 3)
+        self.offset = max(0, min(self.offset, total - self.rows))
+        self.redraw()
+
+    def visible_rows(self):
+        """Return the rows in view, fetching only as far down the heap as the view reaches."""
+        needed = self.offset + self.rows
+        version, rows = self.cached
+        if version != self.leaderboard.version or len(rows) < min(needed, len(self.leaderboard)):
+            rows = self.leaderboard.top(needed)
+            self.cached = (self.leaderboard.version, rows)
+        return rows[self.offset:needed]
+
+    def redraw(self):
+        """Update the row texts and the scrollbar."""
+        rows = self.visible_rows() if self.leaderboard else []
+        for i in range(self.rows):
+            if i < len(rows):
+                rank, player, score = rows[i]
+                self.hud.text(f"row{i}", 8, i * self.row_height + self.row_height / 2,
+                              f"{rank:>6}.  {player:<16}{score:>8}", anchor="w", font=("Courier", 11))
+            else:
+                self.hud.hide(f"row{i}")
+        total = len(self.leaderboard) if self.leaderboard else 0
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
 
 class DiceRollerGame:
     def __init__(self, root):
         self.root = root
         self.root.title("Dice Roller Game")
-        
-        self.player_scores = {}
-        self.current_round = 1
-        self.total_rounds = 3
-        self.current_player_index = 0
-        self.players = []
+
+        self.engine = DiceRollerEngine()
+
+        # Every screen is built once and switched with pack/pack_forget; the
+        # labels follow these variables, so a turn only changes text
+        self.round_var = tk.StringVar()
+        self.turn_var = tk.StringVar()
+        self.result_var = tk.StringVar()
+        self.odds_var = tk.StringVar()
+        self.scoreboard_var = tk.StringVar()
+        self.final_scores_var = tk.StringVar()
+        self.winner_var = tk.StringVar()
+        self.tournament_round_var = tk.StringVar()
+        self.tournament_status_var = tk.StringVar()
+        self.tournament = None
+        self.plain_rolls = True  # False once this game has a roll other than 1-3 plain dice
+
+        # Time from a roll to the redrawn screen; F2 prints the summary
+        self.turn_latency = Histogram(bucket_ms=0.1)
+        self.root.bind("<F2>", self.print_stats)
 
         self.create_setup_screen()
+        self.create_game_screen()
+        self.create_results_screen()
+        self.create_tournament_screen()
+        self.show_screen(self.setup_frame)
+
+    def show_screen(self, frame):
+        """Show one screen and hide the others."""
+        for screen in (self.setup_frame, self.game_frame, self.results_frame, self.tournament_frame):
+            if screen is not frame:
+                screen.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True)
 
     def create_setup_screen(self):
         """Create the setup screen for the game."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.setup_frame = tk.Frame(self.root)
 
-        tk.Label(self.root,
+        tk.Label(self.setup_frame,
                   text="Welcome to Dice Roller Game!",
                     font=("Arial", 16)).pack(pady=10)
 
-        tk.Label(self.root,
-                  text="Enter number of players (2-4):").pack()
-        self.num_players_entry = tk.Entry(self.root)
+        # The prompts show the limits of the mode that is ticked
+        self.players_prompt_var = tk.StringVar()
+        self.rounds_prompt_var = tk.StringVar()
+
+        tk.Label(self.setup_frame,
+                  textvariable=self.players_prompt_var).pack()
+        self.num_players_entry = tk.Entry(self.setup_frame)
         self.num_players_entry.pack()
 
-        tk.Label(self.root,
-                  text="Enter number of rounds (1-5):").pack()
-        self.num_rounds_entry = tk.Entry(self.root)
+        tk.Label(self.setup_frame,
+                  textvariable=self.rounds_prompt_var).pack()
+        self.num_rounds_entry = tk.Entry(self.setup_frame)
         self.num_rounds_entry.pack()
 
-        tk.Button(self.root,
+        self.tournament_mode = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.setup_frame,
+                       text=f"Tournament: up to {MAX_TOURNAMENT_PLAYERS} players and "
+                            f"{MAX_TOURNAMENT_ROUNDS} rounds, rolled automatically",
+                       variable=self.tournament_mode, command=self.update_setup_prompts).pack()
+        self.update_setup_prompts()
+
+        tk.Button(self.setup_frame,
          text="Start Game",
          command=self.start_game).pack(pady=10)
 
+    def update_setup_prompts(self):
+        """Show the player and round limits of the chosen mode."""
+        if self.tournament_mode.get():
+            max_players, max_rounds = MAX_TOURNAMENT_PLAYERS, MAX_TOURNAMENT_ROUNDS
+        else:
+            max_players, max_rounds = 4, 5
+        self.players_prompt_var.set(f"Enter number of players (2-{max_players}):")
+        self.rounds_prompt_var.set(f"Enter number of rounds (1-{max_rounds}):")
+
     def start_game(self):
         """Start the game after validating input."""
+        if self.tournament_mode.get():
+            self.start_tournament()
+            return
         try:
             num_players = int(self.num_players_entry.get())
-            self.total_rounds = int(self.num_rounds_entry.get())
-            if num_players < 2 or num_players > 4 or self.total_rounds < 1 or self.total_rounds > 5:
-               
+            total_rounds = int(self.num_rounds_entry.get())
+            if num_players < 2 or num_players > 4 or total_rounds < 1 or total_rounds > 5:
+
                 raise ValueError
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers for players (2-4) and rounds (1-5).")
             return
 
-        self.players = [f"Player {i+1}" for i in range(num_players)]
-        self.player_scores = {player: 0 for player in self.players}
-        self.current_round = 1
-        self.current_player_index = 0
-        self.create_game_screen()
+        self.engine.start(num_players, total_rounds)
+        self.plain_rolls = True
+        self.result_var.set("")
+        self.update_game_screen()
+        self.show_screen(self.game_frame)
 
     def create_game_screen(self):
         """Create the main game screen."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.game_frame = tk.Frame(self.root)
 
-        tk.Label(self.root, 
-                 text=f"Round {self.current_round} of {self.total_rounds}", font=("Arial", 16)).pack(pady=10)
-        tk.Label(self.root,
-                  text=f"{self.players[self.current_player_index]}'s turn").pack()
+        tk.Label(self.game_frame, textvariable=self.round_var, font=("Arial", 16)).pack(pady=10)
+        tk.Label(self.game_frame, textvariable=self.turn_var).pack()
 
-        tk.Label(self.root,
-                  text="Choose number of dice to roll (1-3):").pack()
-        self.num_dice_entry = tk.Entry(self.root)
+        tk.Label(self.game_frame,
+                  text="Choose number of dice to roll (1-3)\nor enter dice notation such as 4d6kh3+2:").pack()
+        self.num_dice_entry = tk.Entry(self.game_frame)
         self.num_dice_entry.pack()
 
-        tk.Button(self.root,
+        tk.Button(self.game_frame,
                    text="Roll Dice", command=self.roll_dice).pack(pady=10)
-        self.result_label = tk.Label(self.root, text="", font=("Arial", 14))
-        self.result_label.pack(pady=10)
+        tk.Label(self.game_frame, textvariable=self.result_var, font=("Arial", 14)).pack(pady=10)
+        tk.Label(self.game_frame, textvariable=self.odds_var, font=("Arial", 11)).pack()
+
+        tk.Label(self.game_frame, textvariable=self.scoreboard_var, font=("Arial", 12)).pack(pady=10)
 
-        self.scoreboard_label = tk.Label(self.root, text="", font=("Arial", 12))
-        self.scoreboard_label.pack(pady=10)
+    def update_game_screen(self):
+        """Show the current round, turn, scores and odds."""
+        self.round_var.set(f"Round {self.engine.current_round} of {self.engine.total_rounds}")
+        self.turn_var.set(f"{self.engine.current_player}'s turn")
+        self.odds_var.set(self.win_odds_text())
         self.update_scoreboard()
 
     def roll_dice(self):
-        """Roll dice and update the score for the current player."""
-        try:
-            num_dice = int(self.num_dice_entry.get())
-            if num_dice < 1 or num_dice > 3:
-                raise ValueError
-        except ValueError:
+        """Roll dice, or a dice expression, and update the score for the current player."""
+        text = self.num_dice_entry.get().strip()
+        if not text.isdigit():
+            self.roll_expression(text)
+            return
+        num_dice = int(text)
+        if num_dice < 1 or num_dice > MAX_DICE:
             messagebox.showerror("Invalid Input", "Please enter a valid number of dice (1-3).")
             return
 
-        rolls = [random.randint(1, 6) for _ in range(num_dice)]
+        start = time.perf_counter()
+        rolls = self.engine.roll(num_dice)
         total = sum(rolls)
         roll_faces = " ".join(self.get_dice_face(value) for value in rolls)
-        self.player_scores[self.players[self.current_player_index]] += total
+        self.show_roll(f"Rolled: {roll_faces} (Total: {total})", (num_dice, self.engine.sides), total, start)
 
-        self.result_label.config(text=f"Rolled: {roll_faces} (Total: {total})")
+    def roll_expression(self, text):
+        """Roll dice notation such as 4d6kh3+2 for the current player."""
+        try:
+            expression = compile_notation(text)
+        except ValueError as error:
+            messagebox.showerror("Invalid Input", f"Please enter 1-3 dice or valid dice notation.\n{error}")
+            return
+
+        plain_dice = expression.plain_dice()
+        if not (plain_dice and plain_dice[0] <= MAX_DICE and plain_dice[1] == self.engine.sides):
+            self.plain_rolls = False  # win_odds_text assumes 1-3 plain dice per turn
+
+        start = time.perf_counter()
+        total, dice = self.engine.roll_expression(expression)
+        rolled = "  ".join(" ".join(map(str, term)) for term in dice)
+        self.show_roll(f"Rolled {expression.notation}: {rolled} (Total: {total})",
+                       plain_dice, total, start)
+
+    def show_roll(self, result, plain_dice, total, start):
+        """Show a roll, its odds when it was plain NdM dice, and move on to the next turn."""
+        if dicedistribution and plain_dice and plain_dice[0] * (plain_dice[1] - 1) + 1 <= MAX_ODDS_OUTCOMES:
+            exact, at_least = dicedistribution.outcome_odds(*plain_dice, total)
+            result += f"\nA {exact:.1%} roll; {at_least:.1%} chance of {total} or more"
+        self.result_var.set(result)
         self.next_turn()
+        # Idle callbacks run in order, so this one runs after the widgets have redrawn
+        self.root.after_idle(lambda: self.turn_latency.add((time.perf_counter() - start) * 1000))
 
     def get_dice_face(self, value):
         """Return the dice face for a given value."""
@@ -107,54 +266,228 @@ class DiceRollerGame:
         return dice_faces.get(value, str(value))
 
     def next_turn(self):
-        """Advance to the next player's turn or the next round."""
-        self.current_player_index += 1
-        if self.current_player_index >= len(self.players):
-            self.current_player_index = 0
-            self.current_round += 1
-
-        if self.current_round > self.total_rounds:
+        """Show the next player's turn, or the results once the last round is done."""
+        if self.engine.finished:
             self.show_final_results()
-            
+
         else:
-            self.create_game_screen()
+            self.update_game_screen()
+
+    def win_odds_text(self):
+        """Return each player's exact chance of winning from the current scores."""
+        # Every remaining turn is assumed to roll the most dice, the best play with 1-3 plain
+        # dice; once anyone has rolled notation the odds are no longer known and are hidden
+        if dicedistribution is None or not self.plain_rolls:
+            return ""
+        players = self.engine.players
+        try:
+            chances = dicedistribution.win_probabilities([self.engine.player_scores[player] for player in players],
+                                                         self.engine.dice_left(MAX_DICE), self.engine.sides)
+        except ValueError:
+            return ""  # Too many final scores in contention to work out
+        return "Chance to win: " + "  ".join(f"{player}: {chance:.1%}" for player, chance in zip(players, chances))
 
     def update_scoreboard(self):
         """Update the scoreboard display."""
-        scoreboard_text = "Scoreboard:\n" + "\n".join(f"{player}: {score}" for player, score in self.player_scores.items())
-        self.scoreboard_label.config(text=scoreboard_text)
+        scoreboard_text = "Scoreboard:\n" + "\n".join(f"{player}: {score}" for player, score in self.engine.player_scores.items())
+        self.scoreboard_var.set(scoreboard_text)
 
-    def show_final_results(self):
-        """Display the final results of the game."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def print_stats(self, event=None):
+        """Print the turn latency summary."""
+        summary = self.turn_latency.snapshot()
+        print(f"turn_latency: n={summary['count']} mean={summary['mean']:.2f}ms "
+              f"p95={summary['p95']:.1f}ms max={summary['max']:.2f}ms")
+
+    def create_tournament_screen(self):
+        """Create the tournament screen: controls and a virtualized leaderboard."""
+        self.tournament_frame = tk.Frame(self.root)
+
+        tk.Label(self.tournament_frame, textvariable=self.tournament_round_var, font=("Arial", 16)).pack(pady=10)
+        tk.Label(self.tournament_frame, text="Dice for every player (1-3 or notation such as 4d6kh3):").pack()
+        self.tournament_dice_entry = tk.Entry(self.tournament_frame)
+        self.tournament_dice_entry.insert(0, str(MAX_DICE))
+        self.tournament_dice_entry.pack()
+
+        buttons = tk.Frame(self.tournament_frame)
+        buttons.pack(pady=10)
+        tk.Button(buttons, text="Play Round", command=self.play_tournament_round).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Play All Rounds",
+                  command=lambda: self.play_tournament_round(all_rounds=True)).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Play Again",
+                  command=lambda: self.show_screen(self.setup_frame)).pack(side=tk.LEFT, padx=5)
+
+        self.leaderboard_view = LeaderboardView(self.tournament_frame)
+        self.leaderboard_view.frame.pack(padx=10)
+        tk.Label(self.tournament_frame, textvariable=self.tournament_status_var,
+                 font=("Arial", 12), fg="green", wraplength=400).pack(pady=10)
+
+    def start_tournament(self):
+        """Start a tournament after validating input."""
+        try:
+            num_players = int(self.num_players_entry.get())
+            total_rounds = int(self.num_rounds_entry.get())
+            if not 2 <= num_players <= MAX_TOURNAMENT_PLAYERS or not 1 <= total_rounds <= MAX_TOURNAMENT_ROUNDS:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid Input",
+                                 f"Please enter valid numbers for players (2-{MAX_TOURNAMENT_PLAYERS}) "
+                                 f"and rounds (1-{MAX_TOURNAMENT_ROUNDS}).")
+            return
+
+        self.tournament = DiceTournament(num_players, total_rounds, num_dice=MAX_DICE)
+        self.tournament_status_var.set("")
+        self.update_tournament_screen()
+        self.leaderboard_view.show(self.tournament.leaderboard)
+        self.show_screen(self.tournament_frame)
+
+    def play_tournament_round(self, all_rounds=False, tournament=None):
+        """Roll for every player for one round, or for every round left."""
+        # A scheduled round names its tournament, so it stops if another one was started
+        if tournament is not None and tournament is not self.tournament:
+            return
+        tournament = self.tournament
+        if tournament.finished:
+            return
+        text = self.tournament_dice_entry.get().strip()
+        expression = None
+        if text.isdigit() and 1 <= int(text) <= MAX_DICE:
+            self.tournament.num_dice = int(text)
+        else:
+            try:
+                expression = compile_notation(text)
+            except ValueError as error:
+                messagebox.showerror("Invalid Input", f"Please enter 1-3 dice or valid dice notation.\n{error}")
+                return
+
+        start = time.perf_counter()
+        self.tournament.play_round(expression)
+        self.update_tournament_screen()
+        self.leaderboard_view.redraw()
+        self.root.after_idle(lambda: self.turn_latency.add((time.perf_counter() - start) * 1000))
+        if all_rounds and not self.tournament.finished:
+            # One round per pass of the event loop keeps the window responsive
+            self.root.after(1, lambda: self.play_tournament_round(all_rounds=True, tournament=tournament))
 
-        tk.Label(self.root,
+    def update_tournament_screen(self):
+        """Show the round, or the winners once the tournament is over."""
+        tournament = self.tournament
+        if not tournament.finished:
+            self.tournament_round_var.set(f"Round {tournament.current_round} of {tournament.total_rounds} - "
+                                          f"{len(tournament.players)} players")
+            return
+        self.tournament_round_var.set("Final Standings")
+        winner_score, winners = tournament.winners()
+        if len(winners) > 1:
+            shown = ", ".join(winners[:5]) + (f" and {len(winners) - 5} more" if len(winners) > 5 else "")
+            self.tournament_status_var.set(f"{len(winners)} players tie for first with {winner_score} points: {shown}")
+        else:
+            self.tournament_status_var.set(f"The winner is {winners[0]} with {winner_score} points!")
+
+    def create_results_screen(self):
+        """Create the final results screen."""
+        self.results_frame = tk.Frame(self.root)
+
+        tk.Label(self.results_frame,
                   text="Game Over!",
                     font=("Arial", 16)).pack(pady=10)
+        tk.Label(self.results_frame, textvariable=self.final_scores_var, font=("Arial", 12)).pack(pady=10)
+        tk.Label(self.results_frame,
+         textvariable=self.winner_var,
+        font=("Arial", 14), fg="green").pack(pady=10)
+        tk.Button(self.results_frame,
+         text="Play Again",
+         command=lambda: self.show_screen(self.setup_frame)).pack(pady=5)
+        tk.Button(self.results_frame,
+         text="Quit",
+        command=self.root.destroy).pack(pady=5)
 
-        winner_score = max(self.player_scores.values())
-        winners = [player for player, score in self.player_scores.items() if score == winner_score]
+    def show_final_results(self):
+        """Display the final results of the game."""
+        winner_score, winners = self.engine.winners()
 
-        result_text = "\n".join(f"{player}: {score}" for player, score in self.player_scores.items())
-        tk.Label(self.root, text=f"Final Scores:\n{result_text}", font=("Arial", 12)).pack(pady=10)
+        result_text = "\n".join(f"{player}: {score}" for player, score in self.engine.player_scores.items())
+        self.final_scores_var.set(f"Final Scores:\n{result_text}")
 
         if len(winners) > 1:
             winner_text = f"It's a tie between {' and '.join(winners)} with {winner_score} points!"
         else:
             winner_text = f"The winner is {winners[0]} with {winner_score} points!"
+        self.winner_var.set(winner_text)
+        self.show_screen(self.results_frame)
 
-        tk.Label(self.root,
-         text=winner_text, 
-        font=("Arial", 14), fg="green").pack(pady=10)
-        tk.Button(self.root,
-         text="Play Again",
-         command=self.create_setup_screen).pack(pady=5)
-        tk.Button(self.root,
-         text="Quit",
-        command=self.root.quit).pack(pady=5)
+def rebuild_game_screen(game, master):
+    """Destroy and recreate every game screen widget, as each turn used to; kept for benchmark()."""
+    for widget in master.winfo_children():
+        widget.destroy()
 
-if __name__ == "__main__":
+    tk.Label(master,
+             text=f"Round {game.engine.current_round} of {game.engine.total_rounds}", font=("Arial", 16)).pack(pady=10)
+    tk.Label(master,
+             text=f"{game.engine.current_player}'s turn").pack()
+
+    tk.Label(master,
+             text="Choose number of dice to roll (1-3)\nor enter dice notation such as 4d6kh3+2:").pack()
+    tk.Entry(master).pack()
+
+    tk.Button(master,
+              text="Roll Dice", command=game.roll_dice).pack(pady=10)
+    tk.Label(master, text=game.result_var.get(), font=("Arial", 14)).pack(pady=10)
+    tk.Label(master, text=game.win_odds_text(), font=("Arial", 11)).pack()
+
+    scoreboard_text = "Scoreboard:\n" + "\n".join(f"{player}: {score}" for player, score in game.engine.player_scores.items())
+    tk.Label(master, text=scoreboard_text, font=("Arial", 12)).pack(pady=10)
+
+def benchmark(player_counts=(4, 50, 500), turns=100, seed=0):
+    """Time a turn with the rebuilt screen against the persistent one; returns {players: (old, new)} summaries."""
+    # Both paths roll and compute the same texts; a turn ends once Tk has laid the widgets out
     root = tk.Tk()
+    root.withdraw()
     game = DiceRollerGame(root)
-    root.mainloop()
+    rebuild_frame = tk.Frame(root)
+    results = {}
+    for num_players in player_counts:
+        summaries = []
+        for rebuild in (True, False):
+            game.engine.random.seed(seed)
+            game.engine.start(num_players, turns // num_players + 2)
+            if rebuild:
+                game.show_screen(rebuild_frame)
+            else:
+                rebuild_frame.pack_forget()
+                game.update_game_screen()
+                game.show_screen(game.game_frame)
+            root.update_idletasks()
+            latency = Histogram(bucket_ms=0.1, buckets=10000)
+            for _ in range(turns):
+                start = time.perf_counter()
+                rolls = game.engine.roll(MAX_DICE)
+                game.result_var.set(f"Rolled: {' '.join(game.get_dice_face(value) for value in rolls)} "
+                                    f"(Total: {sum(rolls)})")
+                if rebuild:
+                    rebuild_game_screen(game, rebuild_frame)
+                else:
+                    game.update_game_screen()
+                root.update_idletasks()
+                latency.add((time.perf_counter() - start) * 1000)
+            summaries.append(latency.snapshot())
+        results[num_players] = tuple(summaries)
+    root.destroy()
+    return results
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Dice Roller")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="time turns with the old rebuilt screen against the persistent one and exit")
+    parser.add_argument("--turns", type=int, default=100, help="turns per benchmark run")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        for num_players, (old, new) in benchmark(turns=args.turns).items():
+            print(f"{num_players:>4} players: rebuild mean {old['mean']:.2f}ms p95 {old['p95']:.1f}ms  |  "
+                  f"persistent mean {new['mean']:.2f}ms p95 {new['p95']:.1f}ms  "
+                  f"({old['mean'] / new['mean']:.1f}x)")
+    else:
+        root = tk.Tk()
+        game = DiceRollerGame(root)
+        root.mainloop()
@@ -0,0 +1,94 @@
+import random
+
+from leaderboard import Leaderboard
+
+class DiceRollerEngine:
+    def __init__(self, num_players=2, total_rounds=3, sides=6, seed=None):
+        """Initialize the Dice Roller rules without any widgets."""
+        self.sides = sides
+        self.random = random.Random(seed)
+        self.start(num_players, total_rounds)
+
+    def start(self, num_players, total_rounds):
+        """Start a new game with fresh scores."""
+        self.players = [f"Player {i+1}" for i in range(num_players)]
+        self.player_scores = {player: 0 for player in self.players}
+        self.total_rounds = total_rounds
+        self.current_round = 1
+        self.current_player_index = 0
+
+    @property
+    def current_player(self):
+        """Return the name of the player whose turn it is."""
+        return self.players[self.current_player_index]
+
+    @property
+    def finished(self):
+        """Return True once every round has been played."""
+        return self.current_round > self.total_rounds
+
+    def roll(self, num_dice):
+        """Roll dice for the current player, add the total and advance the turn."""
+        rolls = [self.random.randint(1, self.sides) for _ in range(num_dice)]
+        self.player_scores[self.current_player] += sum(rolls)
+        self.next_turn()
+        return rolls
+
+    def roll_expression(self, expression):
+        """Roll a compiled dice expression for the current player, add the total and advance the turn."""
+        total, dice = expression.roll_detailed(self.random)
+        self.player_scores[self.current_player] += total
+        self.next_turn()
+        return total, dice
+
+    def next_turn(self):
+        """Advance to the next player's turn or the next round."""
+        self.current_player_index += 1
+        if self.current_player_index >= len(self.players):
+            self.current_player_index = 0
+            self.current_round += 1
+
+    def dice_left(self, dice_per_turn):
+        """Return how many more dice each player rolls if every remaining turn rolls dice_per_turn."""
+        rounds_left = max(0, self.total_rounds - self.current_round)
+        turns = [rounds_left + (1 if not self.finished and index >= self.current_player_index else 0)
+                 for index in range(len(self.players))]
+        return [turn * dice_per_turn for turn in turns]
+
+    def winners(self):
+        """Return the best score and every player who reached it."""
+        winner_score = max(self.player_scores.values())
+        winners = [player for player, score in self.player_scores.items() if score == winner_score]
+        return winner_score, winners
+
+class DiceTournament:
+    def __init__(self, num_players=1000, total_rounds=5, num_dice=3, sides=6, seed=None):
+        """Every player rolls once per round; standings live in a heap-backed leaderboard."""
+        self.sides = sides
+        self.num_dice = num_dice
+        self.random = random.Random(seed)
+        self.players = [f"Player {i+1}" for i in range(num_players)]
+        self.leaderboard = Leaderboard(self.players)
+        self.total_rounds = total_rounds
+        self.current_round = 1
+
+    @property
+    def finished(self):
+        """Return True once every round has been played."""
+        return self.current_round > self.total_rounds
+
+    def play_round(self, expression=None):
+        """Roll for every player, num_dice dice or a compiled dice expression, and update the standings."""
+        if self.finished:
+            return
+        for player in self.players:
+            if expression is None:
+                total = sum(self.random.randint(1, self.sides) for _ in range(self.num_dice))
+            else:
+                total = expression.roll(self.random)
+            self.leaderboard.add_points(player, total)
+        self.current_round += 1
+
+    def winners(self):
+        """Return the best score and every player who reached it."""
+        return self.leaderboard.winners()
@@ -0,0 +1,129 @@
+import time
+
+class Histogram:
+    def __init__(self, bucket_ms=1.0, buckets=200):
+        """Count millisecond samples into fixed-width buckets."""
+        self.bucket_ms = bucket_ms
+        self.reset(buckets)
+
+    def reset(self, buckets=None):
+        """Forget every sample."""
+        self.counts = [0] * (buckets or len(self.counts))
+        self.overflow = 0  # Samples past the last bucket
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        """Record one sample."""
+        bucket = int(ms / self.bucket_ms)
+        if 0 <= bucket < len(self.counts):
+            self.counts[bucket] += 1
+        else:
+            self.overflow += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        """Return the upper edge of the bucket that holds the p-th percentile."""
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return (bucket + 1) * self.bucket_ms
+        return self.max
+
+    def snapshot(self):
+        """Return the summary statistics and the bucket counts."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "bucket_ms": self.bucket_ms,
+            "buckets": list(self.counts),
+            "overflow": self.overflow,
+        }
+
+class FixedTimestepLoop:
+    def __init__(self, root, tick, render, interval=0.1, max_catch_up=5, clock=time.perf_counter):
+        """Call tick() every interval seconds on a monotonic clock and render() after each frame."""
+        # tick() returns False to stop the loop. A frame that falls behind runs at most
+        # max_catch_up ticks and skips the rest of the backlog.
+        self.root = root
+        self.tick = tick
+        self.render = render
+        self.interval = interval
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.running = False
+        self.after_id = None
+        self.frame_times = Histogram(bucket_ms=0.5)  # Time spent in tick and render per frame
+        self.tick_jitter = Histogram(bucket_ms=1.0)  # How late each tick ran after its deadline
+        self.skipped_ticks = 0
+
+    def start(self):
+        """Start ticking one interval from now."""
+        self.stop()
+        self.running = True
+        self.next_tick = self.clock() + self.interval
+        self.schedule()
+
+    def stop(self):
+        """Stop the loop and cancel the pending frame."""
+        self.running = False
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def set_interval(self, interval):
+        """Change the tick period from the next tick on."""
+        if self.running:
+            self.next_tick += interval - self.interval
+        self.interval = interval
+
+    def schedule(self):
+        """Wake up in time for the next tick deadline."""
+        delay = max(1, round((self.next_tick - self.clock()) * 1000))
+        self.after_id = self.root.after(delay, self.frame)
+
+    def frame(self):
+        """Run every tick that is due, then render once."""
+        self.after_id = None
+        if not self.running or not self.root.winfo_exists():
+            return
+        start = self.clock()
+        ticks = 0
+        # Deadlines advance by exact intervals, so render time never shifts later ticks
+        while self.running and start >= self.next_tick and ticks < self.max_catch_up:
+            self.tick_jitter.add((start - self.next_tick) * 1000)
+            self.next_tick += self.interval
+            ticks += 1
+            if not self.tick():
+                self.running = False
+
+        # Too far behind: drop the backlog instead of spiralling
+        behind = start - self.next_tick
+        if self.running and behind >= self.interval:
+            skipped = int(behind // self.interval)
+            self.skipped_ticks += skipped
+            self.next_tick += skipped * self.interval
+
+        if ticks:
+            self.render()
+            self.frame_times.add((self.clock() - start) * 1000)
+        if self.running:
+            self.schedule()
+
+    def stats(self):
+        """Return the frame-time and tick-jitter histograms and the skipped tick count."""
+        return {"frame_times": self.frame_times.snapshot(),
+                "tick_jitter": self.tick_jitter.snapshot(),
+                "skipped_ticks": self.skipped_ticks,
+                "interval": self.interval}
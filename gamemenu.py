@@ -1,43 +1,272 @@
 import tkinter as tk
 from tkinter import messagebox
+import argparse
+import multiprocessing
 import os
+import statistics
 import subprocess
+import sys
+import threading
+import time
+import warnings
+
+from gameregistry import GameRegistry
+
+# Games are discovered from their GAME_INFO metadata and imported on first launch
+registry = GameRegistry(os.path.dirname(os.path.abspath(__file__)))
 
 # Function to run the selected game
 def run_game(game_name):
     try:
         # Use subprocess to run the game scripts
-        subprocess.run(["python", f"{game_name}.py"])
+        subprocess.run([sys.executable, f"{game_name}.py"])
     except Exception as e:
         messagebox.showerror("Error", f"Failed to run {game_name}: {e}")
 
+def load_game_class(game_name):
+    """Import a game module once and return its game class."""
+    return registry.load(game_name)
+
+def open_game(root, game_name):
+    """Open the selected game in a Toplevel window of the menu's root."""
+    window = None
+    try:
+        game_class = load_game_class(game_name)
+        window = tk.Toplevel(root)
+        game_class(window)
+        return window
+    except Exception as e:
+        if window is not None:
+            window.destroy()  # Don't leave an empty window behind the error
+        messagebox.showerror("Error", f"Failed to open {game_name}: {e}")
+        return None
+
+def measure_launch_latency(root, game_name, repeats=5):
+    """Return the median launch latency of both launchers, in seconds."""
+    # The subprocess path is measured up to the game's first drawn frame
+    script = (f"import tkinter as tk; import {game_name}; root = tk.Tk(); "
+              f"{game_name}.{registry.discover()[game_name].class_name}(root); root.update(); root.destroy()")
+    subprocess_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", script], check=True)
+        subprocess_times.append(time.perf_counter() - start)
+
+    in_process_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        window = open_game(root, game_name)
+        root.update()
+        in_process_times.append(time.perf_counter() - start)
+        window.destroy()
+
+    return {"subprocess": statistics.median(subprocess_times),
+            "in-process": statistics.median(in_process_times)}
+
+def _game_worker(conn):
+    """Wait for a game name from the menu, then run that game in this process."""
+    try:
+        game_name = conn.recv()
+    except EOFError:
+        return  # The pool was shut down before this worker was used
+    conn.close()
+    root = tk.Tk()
+    load_game_class(game_name)(root)
+    root.mainloop()
+
+class WorkerPool:
+    """A pool of pre-started interpreters that each run one game in isolation."""
+
+    def __init__(self, size=2):
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self.context = multiprocessing.get_context("forkserver")
+            # Workers are forked from a server that already imported tkinter and the games
+            self.context.set_forkserver_preload(["tkinter"] + list(registry.discover()))
+        else:
+            self.context = multiprocessing.get_context("spawn")
+        self.size = size
+        self.lock = threading.Lock()
+        self.idle = []  # (process, connection) pairs waiting for a game
+        self.pending = []  # Games requested while no worker was idle
+        self.running = []  # (game name, process) pairs that are playing
+        self.refilling = False
+        self.closed = False
+        self.refill()
+
+    def _start_worker(self):
+        """Start one worker process and return it with its connection."""
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(target=_game_worker, args=(child_conn,))
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def refill(self):
+        """Top the pool back up to its size in a background thread."""
+        with self.lock:
+            if self.refilling or self.closed:
+                return
+            self.refilling = True
+        threading.Thread(target=self._refill, daemon=True).start()
+
+    def _refill(self):
+        while True:
+            with self.lock:
+                if self.closed or len(self.idle) >= self.size and not self.pending:
+                    self.refilling = False
+                    return
+            process, conn = self._start_worker()
+            with self.lock:
+                if self.closed:
+                    # shutdown() ran while the worker was starting; closing the pipe lets it exit
+                    conn.close()
+                    self.refilling = False
+                    return
+                self.idle.append((process, conn))
+                self._dispatch_pending()
+
+    def _dispatch_pending(self):
+        """Hand queued games to idle workers. The lock must be held."""
+        # A worker that died while idle is thrown away and its game stays queued; both
+        # callers refill the pool afterwards, which replaces the worker
+        while self.pending and self.idle:
+            process, conn = self.idle.pop(0)
+            game_name = self.pending[0]
+            try:
+                if not process.is_alive():
+                    raise BrokenPipeError
+                conn.send(game_name)
+            except (BrokenPipeError, OSError):
+                conn.close()
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+                continue
+            self.pending.pop(0)
+            conn.close()
+            self.running.append((game_name, process))
+
+    def launch(self, game_name):
+        """Hand a game to an idle worker without waiting for a process to start."""
+        with self.lock:
+            self.pending.append(game_name)
+            self._dispatch_pending()
+        self.refill()
+
+    def reap(self):
+        """Return (game name, exit code) for each game that has ended since the last call."""
+        finished = []
+        with self.lock:
+            for game_name, process in list(self.running):
+                if process.exitcode is not None:
+                    process.join()
+                    self.running.remove((game_name, process))
+                    finished.append((game_name, process.exitcode))
+        return finished
+
+    def shutdown(self):
+        """Release the idle workers. Games that are still running keep playing."""
+        with self.lock:
+            self.closed = True
+            for process, conn in self.idle:
+                conn.close()
+            self.idle.clear()
+
 # Main Menu GUI using Tkinter
 class GameMenu:
-    def __init__(self, root):
+    def __init__(self, root, launcher="in-process", pool_size=2, startup_budget=0.5):
+        self.start_time = time.perf_counter()
+        self.startup_budget = startup_budget
         self.root = root
         self.root.title("Game Menu")
+        self.launcher = launcher
+        self.pool = None
+        if launcher == "isolated":
+            self.pool = WorkerPool(pool_size)
+            self.root.protocol("WM_DELETE_WINDOW", self.exit_menu)
 
         # Create a frame for the buttons
         frame = tk.Frame(self.root)
         frame.pack(pady=20)
 
         # Create buttons for each game
-        games = [
-            ("Dice Roller", "diceroller"),
-            ("Guess the Number", "guessthenumber"),
-            ("Rock Paper Scissors", "rockpaperscissor"),
-            ("Snake and Ladder", "snakeandladder"),
-            ("Snake Game", "snakegame"),
-            ("Tic Tac Toe", "tictactoe")
-        ]
-        
-        for game_name, game_file in games:
-            btn = tk.Button(frame, text=game_name, width=20, height=2, 
-                            command=lambda g=game_file: run_game(g))
+        for game_file, entry in registry.discover().items():
+            btn = tk.Button(frame, text=entry.title, width=20, height=2,
+                            command=lambda g=game_file: self.launch(g))
             btn.pack(pady=10)
 
+        # Status line for games running in isolated processes
+        self.status_label = tk.Label(self.root, text="", font=("Arial", 10))
+        self.status_label.pack(pady=5)
+        if self.pool:
+            self.check_workers()
+
+        # Startup is over once the menu has been drawn
+        self.root.after_idle(self.check_startup_time)
+
+    def check_startup_time(self):
+        """Warn when building the menu took longer than the startup budget."""
+        self.startup_time = time.perf_counter() - self.start_time
+        if self.startup_time > self.startup_budget:
+            message = (f"Menu startup took {self.startup_time * 1000:.0f} ms, "
+                       f"over the {self.startup_budget * 1000:.0f} ms budget")
+            warnings.warn(message, RuntimeWarning)
+            self.status_label.config(text=message)
+
+    def launch(self, game_file):
+        """Launch a game with the configured launcher."""
+        if self.launcher == "subprocess":
+            run_game(game_file)
+        elif self.launcher == "isolated":
+            self.pool.launch(game_file)
+            self.status_label.config(text=f"Started {game_file}")
+        else:
+            open_game(self.root, game_file)
+
+    def check_workers(self):
+        """Report isolated games that have exited or crashed."""
+        for game_file, exitcode in self.pool.reap():
+            if exitcode == 0:
+                self.status_label.config(text=f"{game_file} exited")
+            else:
+                self.status_label.config(text=f"{game_file} crashed (exit code {exitcode})")
+                messagebox.showerror("Game Crashed", f"{game_file} exited with code {exitcode}.")
+        self.root.after(250, self.check_workers)
+
+    def exit_menu(self):
+        """Shut down the worker pool and close the menu."""
+        if self.pool:
+            self.pool.shutdown()
+        self.root.destroy()
+
 # Main program entry point
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multigame menu")
+    parser.add_argument("--launcher", choices=["in-process", "subprocess", "isolated"],
+                        default="in-process",
+                        help="open games in the menu's own Tk root, in a new interpreter, "
+                             "or in a pre-started worker process")
+    parser.add_argument("--pool-size", type=int, default=2,
+                        help="number of idle worker processes kept by the isolated launcher")
+    parser.add_argument("--startup-budget", type=float, default=0.5,
+                        help="warn when the menu takes longer than this many seconds to start")
+    parser.add_argument("--import-report", action="store_true",
+                        help="print the import cost of each game launched in-process on exit")
+    parser.add_argument("--measure", action="store_true",
+                        help="print the launch latency of both launchers and exit")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    menu = GameMenu(root)
-    root.mainloop()
+    if args.measure:
+        for game_file in registry.discover():
+            latency = measure_launch_latency(root, game_file)
+            print(f"{game_file:18} subprocess: {latency['subprocess'] * 1000:8.1f} ms  "
+                  f"in-process: {latency['in-process'] * 1000:8.1f} ms")
+        root.destroy()
+    else:
+        menu = GameMenu(root, launcher=args.launcher, pool_size=args.pool_size,
+                        startup_budget=args.startup_budget)
+        root.mainloop()
+        if args.import_report:
+            for game_file, seconds, imported in registry.import_report():
+                print(f"{game_file:18} {seconds * 1000:8.1f} ms  ({imported} modules imported)")
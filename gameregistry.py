@@ -0,0 +1,113 @@
+import ast
+import importlib
+import json
+import os
+import sys
+import time
+
+# Installed packages can add games under this entry point group ("Title = module:Class")
+ENTRY_POINT_GROUP = "multigame.games"
+
+# Discovered metadata is cached here so a warm start only has to stat the game files
+CACHE_FILE = ".gameregistry.json"
+
+class GameEntry:
+    def __init__(self, title, module, class_name):
+        """Describe a game that can be imported on demand."""
+        self.title = title
+        self.module = module
+        self.class_name = class_name
+
+def read_game_info(path):
+    """Return the GAME_INFO dict declared in a module file without importing it."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    if "GAME_INFO" not in source:
+        return None
+    for node in ast.parse(source, path).body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "GAME_INFO"):
+            return ast.literal_eval(node.value)
+    return None
+
+class GameRegistry:
+    def __init__(self, directory, entry_point_group=ENTRY_POINT_GROUP):
+        """Create a registry for the game modules in a directory."""
+        self.directory = directory
+        self.entry_point_group = entry_point_group
+        self.entries = None  # Module name -> GameEntry, filled in by discover()
+        self.classes = {}  # Module name -> game class, for games imported so far
+        self.import_times = {}  # Module name -> (seconds, modules newly imported)
+
+    def discover(self):
+        """Find the available games without importing any of them."""
+        if self.entries is not None:
+            return self.entries
+
+        cache_path = os.path.join(self.directory, CACHE_FILE)
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+        entries = {}
+        new_cache = {}
+        for filename in sorted(os.listdir(self.directory)):
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(self.directory, filename)
+            stat = os.stat(path)
+            key = [stat.st_mtime_ns, stat.st_size]
+            cached = cache.get(filename)
+            if cached and cached["key"] == key:
+                info = cached["info"]
+            else:
+                info = read_game_info(path)
+            new_cache[filename] = {"key": key, "info": info}
+            if info:
+                module = filename[:-3]
+                entries[module] = GameEntry(info["title"], module, info["class"])
+
+        for entry_point in self._entry_points():
+            module, _, class_name = entry_point.value.partition(":")
+            entries[module] = GameEntry(entry_point.name, module, class_name)
+
+        if new_cache != cache:
+            try:
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(new_cache, f)
+            except OSError:
+                pass  # A read-only install just skips the cache
+
+        self.entries = dict(sorted(entries.items(), key=lambda item: item[1].title.lower()))
+        return self.entries
+
+    def _entry_points(self):
+        """Return the games registered by installed packages."""
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            return []
+        try:
+            return list(entry_points(group=self.entry_point_group))
+        except TypeError:  # Python < 3.10 returns a dict of groups
+            return list(entry_points().get(self.entry_point_group, []))
+
+    def load(self, module):
+        """Import a game module on first use and return its game class."""
+        if module not in self.classes:
+            entry = self.discover()[module]
+            already_loaded = set(sys.modules)
+            start = time.perf_counter()
+            game_module = importlib.import_module(entry.module)
+            elapsed = time.perf_counter() - start
+            self.import_times[module] = (elapsed, sorted(set(sys.modules) - already_loaded))
+            self.classes[module] = getattr(game_module, entry.class_name)
+        return self.classes[module]
+
+    def import_report(self):
+        """Return the recorded import cost of each game, slowest first."""
+        return sorted(((module, seconds, len(imported))
+                       for module, (seconds, imported) in self.import_times.items()),
+                      key=lambda row: row[1], reverse=True)
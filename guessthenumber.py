@@ -1,7 +1,10 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
-import time
+
+from guessthenumberengine import GuessTheNumberEngine
+
+# Menu metadata, read by the game registry without importing this module
+GAME_INFO = {"title": "Guess the Number", "class": "GuessTheNumberGame"}
 
 class GuessTheNumberGame:
     def __init__(self, root):
@@ -9,16 +12,8 @@ class GuessTheNumberGame:
         self.root = root
         self.root.title("Guess the Number Game")
         
-        # Game Variables
-        self.target_number = random.randint(1, 100)
-        self.attempts = 0
-        self.max_attempts = 10
-        self.time_left = 30  # Time limit in seconds
-        self.difficulty = "Medium"
-        
-        # Initialize Highscore Variables
-        self.best_time = float('inf')
-        self.best_attempts = float('inf')
+        # Game rules, attempts, timer and highscores
+        self.engine = GuessTheNumberEngine()
         
         # Create the main game widgets
         self.create_widgets()
@@ -56,11 +51,11 @@ class GuessTheNumberGame:
         self.result_label.pack(pady=20)
         
         # Label for the number of attempts
-        self.attempts_label = tk.Label(self.root, text=f"Attempts: 0/{self.max_attempts}", font=("Arial", 12))
+        self.attempts_label = tk.Label(self.root, text=f"Attempts: 0/{self.engine.max_attempts}", font=("Arial", 12))
         self.attempts_label.pack(pady=5)
         
         # Timer Label
-        self.timer_label = tk.Label(self.root, text=f"Time Left: {self.time_left}s", font=("Arial", 12))
+        self.timer_label = tk.Label(self.root, text=f"Time Left: {self.engine.time_left}s", font=("Arial", 12))
         self.timer_label.pack(pady=5)
         
         # Hint button
@@ -72,7 +67,7 @@ class GuessTheNumberGame:
         self.reset_button.pack(pady=10)
         
         # Highscore Display
-        self.score_label = tk.Label(self.root, text=f"Best Attempts: {self.best_attempts}, Best Time: {self.best_time}s", font=("Arial", 12))
+        self.score_label = tk.Label(self.root, text=self.get_highscore_text(), font=("Arial", 12))
         self.score_label.pack(pady=5)
 
         # Start the timer
@@ -80,29 +75,22 @@ class GuessTheNumberGame:
 
     def change_difficulty(self, difficulty):
         """Change the difficulty of the game."""
-        self.difficulty = difficulty
-        if difficulty == "Easy":
-            self.max_attempts = 15
-            self.time_left = 40
-        elif difficulty == "Medium":
-            self.max_attempts = 10
-            self.time_left = 30
-        elif difficulty == "Hard":
-            self.max_attempts = 7
-            self.time_left = 20
+        self.engine.set_difficulty(difficulty)
         
         # Reset for new difficulty
         self.reset_game()
 
     def update_timer(self):
         """Update the countdown timer."""
-        if self.time_left > 0:
-            self.time_left -= 1
-            self.timer_label.config(text=f"Time Left: {self.time_left}s")
+        if not self.root.winfo_exists():  # The game window was closed
+            return
+        if self.engine.time_left > 0:
+            self.engine.tick()
+            self.timer_label.config(text=f"Time Left: {self.engine.time_left}s")
             self.root.after(1000, self.update_timer)
         else:
-            if self.attempts < self.max_attempts:
-                self.result_label.config(text=f"Game Over! Time's up! The number was {self.target_number}.")
+            if not self.engine.won and not self.engine.out_of_attempts:
+                self.result_label.config(text=f"Game Over! Time's up! The number was {self.engine.target_number}.")
                 self.check_button.config(state="disabled")
                 self.ask_play_again()
 
@@ -118,44 +106,39 @@ class GuessTheNumberGame:
             messagebox.showerror("Out of Range", "Your guess must be between 1 and 100.")
             return
         
-        self.attempts += 1
-        self.attempts_label.config(text=f"Attempts: {self.attempts}/{self.max_attempts}")
+        result = self.engine.guess(guess)
+        self.attempts_label.config(text=f"Attempts: {self.engine.attempts}/{self.engine.max_attempts}")
         
-        if guess < self.target_number:
+        if result == "low":
             self.result_label.config(text="Too low! Try again.")
-        elif guess > self.target_number:
+        elif result == "high":
             self.result_label.config(text="Too high! Try again.")
         else:
-            self.result_label.config(text=f"Congratulations! You guessed the number in {self.attempts} attempts.")
+            self.result_label.config(text=f"Congratulations! You guessed the number in {self.engine.attempts} attempts.")
             self.check_button.config(state="disabled")
             self.update_highscore()
             self.ask_play_again()
 
         # Check if the player has exceeded the max attempts
-        if self.attempts >= self.max_attempts and guess != self.target_number:
-            self.result_label.config(text=f"Game Over! The number was {self.target_number}.")
+        if self.engine.out_of_attempts:
+            self.result_label.config(text=f"Game Over! The number was {self.engine.target_number}.")
             self.check_button.config(state="disabled")
             self.ask_play_again()
 
     def give_hint(self):
         """Provide a hint to the player."""
-        if self.attempts == 0:
+        if self.engine.attempts == 0:
             messagebox.showinfo("Hint", "You haven't made a guess yet! Try guessing first.")
         else:
-            if self.target_number % 2 == 0:
-                hint = "The number is even."
-            else:
-                hint = "The number is odd."
-            messagebox.showinfo("Hint", hint)
+            messagebox.showinfo("Hint", f"The number is {self.engine.hint()}.")
 
     def update_highscore(self):
-        """Update the highscore (best attempts and time)."""
-        if self.attempts < self.best_attempts:
-            self.best_attempts = self.attempts
-        if self.time_left > 0 and (30 - self.time_left) < self.best_time:
-            self.best_time = 30 - self.time_left
+        """Show the highscore (best attempts and time)."""
+        self.score_label.config(text=self.get_highscore_text())
 
-        self.score_label.config(text=f"Best Attempts: {self.best_attempts}, Best Time: {self.best_time}s")
+    def get_highscore_text(self):
+        """Return the current highscore text."""
+        return f"Best Attempts: {self.engine.best_attempts}, Best Time: {self.engine.best_time}s"
     
     def ask_play_again(self):
         """Ask the player if they want to play again."""
@@ -166,14 +149,12 @@ class GuessTheNumberGame:
 
     def reset_game(self):
         """Reset the game for a new round."""
-        self.target_number = random.randint(1, 100)
-        self.attempts = 0
-        self.time_left = 30
+        self.engine.reset()
         self.result_label.config(text="Make a guess to start.")
         self.guess_entry.delete(0, tk.END)
         self.check_button.config(state="normal")
-        self.attempts_label.config(text=f"Attempts: 0/{self.max_attempts}")
-        self.timer_label.config(text=f"Time Left: {self.time_left}s")
+        self.attempts_label.config(text=f"Attempts: 0/{self.engine.max_attempts}")
+        self.timer_label.config(text=f"Time Left: {self.engine.time_left}s")
         self.update_timer()
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import random
+
+# Difficulty -> (max attempts, time limit in seconds)
+DIFFICULTIES = {"Easy": (15, 40), "Medium": (10, 30), "Hard": (7, 20)}
+
+class GuessTheNumberEngine:
+    def __init__(self, difficulty="Medium", low=1, high=100, seed=None):
+        """Initialize the Guess the Number rules without any widgets."""
+        self.low = low
+        self.high = high
+        self.random = random.Random(seed)
+        self.best_time = float('inf')
+        self.best_attempts = float('inf')
+        self.set_difficulty(difficulty)
+
+    def set_difficulty(self, difficulty):
+        """Change the difficulty and start a new round."""
+        self.difficulty = difficulty
+        self.max_attempts, self.time_limit = DIFFICULTIES[difficulty]
+        self.reset()
+
+    def reset(self):
+        """Pick a new number and restore the attempts and the clock."""
+        self.target_number = self.random.randint(self.low, self.high)
+        self.attempts = 0
+        self.time_left = self.time_limit
+        self.won = False
+
+    @property
+    def out_of_attempts(self):
+        """Return True once every attempt has been used without a win."""
+        return not self.won and self.attempts >= self.max_attempts
+
+    def tick(self):
+        """Take one second off the clock and return True while time is left."""
+        if self.time_left > 0:
+            self.time_left -= 1
+        return self.time_left > 0
+
+    def guess(self, number):
+        """Check a guess and return "low", "high" or "correct"."""
+        if not self.low <= number <= self.high:
+            raise ValueError(f"Guess must be between {self.low} and {self.high}")
+        self.attempts += 1
+        if number < self.target_number:
+            return "low"
+        if number > self.target_number:
+            return "high"
+        self.won = True
+        self.update_highscore()
+        return "correct"
+
+    def update_highscore(self):
+        """Update the best attempts and the best time."""
+        if self.attempts < self.best_attempts:
+            self.best_attempts = self.attempts
+        elapsed = self.time_limit - self.time_left
+        if self.time_left > 0 and elapsed < self.best_time:
+            self.best_time = elapsed
+
+    def hint(self):
+        """Return whether the number is "even" or "odd"."""
+        return "even" if self.target_number % 2 == 0 else "odd"
@@ -0,0 +1,135 @@
+import heapq
+import itertools
+
+class IndexedMaxHeap:
+    def __init__(self):
+        """A binary max-heap whose items can change priority in O(log n)."""
+        # Priorities are tuples of numbers, so the top-k frontier can negate them
+        self.heap = []  # Items in heap order
+        self.priority = {}
+        self.position = {}  # Item -> index in self.heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def push(self, item, priority):
+        """Add a new item."""
+        self.priority[item] = priority
+        self.position[item] = len(self.heap)
+        self.heap.append(item)
+        self.sift_up(len(self.heap) - 1)
+
+    def update(self, item, priority):
+        """Change an item's priority and restore the heap order."""
+        old = self.priority[item]
+        self.priority[item] = priority
+        if priority > old:
+            self.sift_up(self.position[item])
+        else:
+            self.sift_down(self.position[item])
+
+    def peek(self):
+        """Return the item with the highest priority."""
+        return self.heap[0]
+
+    def swap(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.position[heap[i]] = i
+        self.position[heap[j]] = j
+
+    def sift_up(self, index):
+        priority = self.priority
+        while index:
+            parent = (index - 1) // 2
+            if priority[self.heap[index]] <= priority[self.heap[parent]]:
+                break
+            self.swap(index, parent)
+            index = parent
+
+    def sift_down(self, index):
+        priority = self.priority
+        size = len(self.heap)
+        while True:
+            largest = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and priority[self.heap[child]] > priority[self.heap[largest]]:
+                    largest = child
+            if largest == index:
+                return
+            self.swap(index, largest)
+            index = largest
+
+    def best_first(self):
+        """Yield items from the highest priority down without changing the heap; the k-th costs O(log k)."""
+        # Best-first walk of the heap: the next item is always a child of one already taken
+        if not self.heap:
+            return
+        frontier = [(tuple(-x for x in self.priority[self.heap[0]]), 0)]
+        while frontier:
+            _, index = heapq.heappop(frontier)
+            yield self.heap[index]
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self.heap):
+                    heapq.heappush(frontier, (tuple(-x for x in self.priority[self.heap[child]]), child))
+
+    def top(self, k):
+        """Return the k highest-priority items in order, in O(k log k)."""
+        return list(itertools.islice(self.best_first(), k))
+
+class Leaderboard:
+    def __init__(self, players=()):
+        """Player scores kept in an indexed max-heap; equal scores stay in join order."""
+        self.heap = IndexedMaxHeap()
+        self.scores = {}
+        self.order = {}
+        self.version = 0  # Bumped on every change, so views can cache what they drew
+        for player in players:
+            self.add(player)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def add(self, player, score=0):
+        """Add a player."""
+        self.order[player] = len(self.order)
+        self.scores[player] = score
+        self.heap.push(player, (score, -self.order[player]))
+        self.version += 1
+
+    def add_points(self, player, points):
+        """Add to a player's score in O(log n)."""
+        self.set_score(player, self.scores[player] + points)
+
+    def set_score(self, player, score):
+        """Set a player's score in O(log n)."""
+        self.scores[player] = score
+        self.heap.update(player, (score, -self.order[player]))
+        self.version += 1
+
+    def top(self, k):
+        """Return the k best (rank, player, score) rows; tied players share a rank."""
+        return self.ranked(self.heap.top(k))
+
+    def ranking(self):
+        """Return every player as (rank, player, score), best first, with competition ranks (1, 2, 2, 4)."""
+        return self.ranked(self.heap.best_first())
+
+    def ranked(self, players):
+        """Attach competition ranks to players already in leaderboard order."""
+        rows = []
+        for position, player in enumerate(players):
+            score = self.scores[player]
+            rank = rows[-1][0] if rows and rows[-1][2] == score else position + 1
+            rows.append((rank, player, score))
+        return rows
+
+    def winners(self):
+        """Return the best score and every player who reached it, walking the heap only as far as the ties."""
+        if not self.scores:
+            return None, []
+        best = self.scores[self.heap.peek()]
+        return best, list(itertools.takewhile(lambda player: self.scores[player] == best, self.heap.best_first()))
@@ -1,19 +1,23 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
 import time
 
+from rockpaperscissorai import DIFFICULTIES, AdaptiveOpponent
+from rockpaperscissorengine import CHOICES, RockPaperScissorsEngine
+
+# Menu metadata, read by the game registry without importing this module
+GAME_INFO = {"title": "Rock Paper Scissors", "class": "RockPaperScissorsGame"}
+
 class RockPaperScissorsGame:
-    def __init__(self, root):
-        """Initialize the Rock Paper Scissors game."""
+    def __init__(self, root, difficulty="Medium"):
+        """Initialize the Rock Paper Scissors game against an opponent that learns the player's habits."""
         self.root = root
         self.root.title("Rock Paper Scissors")
 
-        self.choices = ["Rock", "Paper", "Scissors"]
-        self.player_score = 0
-        self.computer_score = 0
-        self.rounds = 0
-        self.history = []  # To store the history of the rounds
+        self.choices = CHOICES
+        # The opponent keeps learning across resets, so habits carry over between games
+        self.opponent = AdaptiveOpponent(difficulty)
+        self.engine = RockPaperScissorsEngine(opponent=self.opponent)
         
         # Create the game interface
         self.create_widgets()
@@ -36,6 +40,13 @@ class RockPaperScissorsGame:
         self.round_label.pack(side=tk.LEFT, 
                               padx=20)
 
+        # Difficulty of the computer opponent
+        self.difficulty_var = tk.StringVar(value=self.opponent.difficulty)
+        tk.Label(self.root, text="Computer Difficulty:", font=("Arial", 12)).pack()
+        self.difficulty_menu = tk.OptionMenu(self.root, self.difficulty_var, *DIFFICULTIES,
+                                             command=self.change_difficulty)
+        self.difficulty_menu.pack(pady=5)
+
         # Display for the result of each round
         self.result_label = tk.Label(self.root, text="Choose an option to start", font=("Arial", 16))
         self.result_label.pack(pady=20)
@@ -85,81 +96,57 @@ class RockPaperScissorsGame:
         self.paper_button.bind("<ButtonPress-1>", lambda e: animate_button(self.paper_button))
         self.scissors_button.bind("<ButtonPress-1>", lambda e: animate_button(self.scissors_button))
 
+    def change_difficulty(self, difficulty):
+        """Change how well the computer predicts the player."""
+        self.opponent.set_difficulty(difficulty)
+
     def player_choice(self, player_choice):
         """Handle the player's choice."""
-        computer_choice = random.choice(self.choices)
-        result = self.determine_winner(player_choice, computer_choice)
+        computer_choice, result = self.engine.play(player_choice)
 
-        self.update_scores(result)
         self.update_display(player_choice, computer_choice, result)
-        self.rounds += 1
-        self.round_label.config(text=f"Rounds: {self.rounds}")
-        
-        # Add to the history
-        self.history.append(f"Round {self.rounds}: Player chose {player_choice}, Computer chose {computer_choice} - {result}")
+        self.round_label.config(text=f"Rounds: {self.engine.rounds}")
         self.update_history()
 
-    def determine_winner(self, player_choice, computer_choice):
-        """Determine the winner of the round."""
-        if player_choice == computer_choice:
-            return "Tie"
-        elif (player_choice == "Rock" and computer_choice == "Scissors") or \
-             (player_choice == "Paper" and computer_choice == "Rock") or \
-             (player_choice == "Scissors" and computer_choice == "Paper"):
-            return "Player"
-        else:
-            return "Computer"
-
-    def update_scores(self, result):
-        """Update the score based on the round result."""
-        if result == "Player":
-            self.player_score += 1
-        elif result == "Computer":
-            self.computer_score += 1
-
     def update_display(self,
                         player_choice, computer_choice, result):
         """Update the display with the choices and result of the round."""
         self.result_label.config(text=f"Player chose: {player_choice}\nComputer chose: {computer_choice}\nResult: {result}")
         self.score_label.config(text=self.get_score_text())
 
-        if self.player_score == 10 or self.computer_score == 10:
+        if self.engine.winner:
             self.end_game()
 
     def get_score_text(self):
         """Return the current score text."""
-        return f"Player: {self.player_score}  |  Computer: {self.computer_score}"
+        return f"Player: {self.engine.player_score}  |  Computer: {self.engine.computer_score}"
 
     def end_game(self):
         """End the game when either the player or computer reaches 10 points."""
-        if self.player_score == 10:
-            winner = "Player"
-        elif self.computer_score == 10:
-            winner = "Computer"
-        
         messagebox.showinfo("Game Over",
-                             f"{winner} wins the game!\nFinal Score:\nPlayer: {self.player_score}  |  Computer: {self.computer_score}")
+                             f"{self.engine.winner} wins the game!\nFinal Score:\n{self.get_score_text()}")
         self.reset_game()
 
     def update_history(self):
-        """Update the history display."""
-        if len(self.history) > 5:
-            self.history = self.history[-5:]
-        
-        self.history_label.config(text="History:\n" + "\n".join(self.history))
+        """Update the history display with the last five rounds."""
+        if not self.engine.history:
+            self.history_label.config(text="History: No rounds played yet.")
+            return
+        first_round = max(self.engine.rounds - 5, 0) + 1
+        lines = [f"Round {first_round + i}: Player chose {player_choice}, Computer chose {computer_choice} - {result}"
+                 for i, (player_choice, computer_choice, result) in enumerate(self.engine.history[-5:])]
+        self.history_label.config(text="History:\n" + "\n".join(lines))
 
     def show_stats(self):
         """Show the detailed stats in a message box."""
-        stats = f"Player Score: {self.player_score}\nComputer Score: {self.computer_score}\nRounds Played: {self.rounds}"
+        stats = (f"Player Score: {self.engine.player_score}\nComputer Score: {self.engine.computer_score}\n"
+                 f"Rounds Played: {self.engine.rounds}\nDifficulty: {self.opponent.difficulty}")
         messagebox.showinfo("Game Stats",
                              stats)
 
     def reset_game(self):
         """Reset the game for a new round."""
-        self.player_score = 0
-        self.computer_score = 0
-        self.rounds = 0
-        self.history.clear()
+        self.engine.reset()
         self.result_label.config(text="Choose an option to start")
         self.score_label.config(text=self.get_score_text())
         self.round_label.config(text="Rounds: 0")
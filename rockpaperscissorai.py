@@ -0,0 +1,120 @@
+import argparse
+import random
+import time
+
+from rockpaperscissorengine import BEATS, CHOICES, determine_winner
+
+# Difficulty -> (longest context in rounds, chance of a random move instead of the counter)
+DIFFICULTIES = {"Random": (0, 1.0), "Easy": (1, 0.5), "Medium": (3, 0.2), "Hard": (6, 0.0)}
+MAX_ORDER = max(order for order, _ in DIFFICULTIES.values())
+
+INDEX = {choice: i for i, choice in enumerate(CHOICES)}
+# COUNTER[i] is the move that beats CHOICES[i]
+COUNTER = [CHOICES.index(next(c for c in CHOICES if BEATS[c] == choice)) for choice in CHOICES]
+ROUND_SYMBOLS = len(CHOICES) * len(CHOICES)
+
+class NGramPredictor:
+    def __init__(self, max_order=6):
+        """Predict the player's next move from counts of what followed every recent context."""
+        # A context of order k is the last k rounds, each round being the pair of moves
+        # (9 symbols), packed into one base-9 integer. Every update touches one count per
+        # order, so learning and predicting are O(max_order) whatever the history length.
+        self.max_order = max_order
+        self.counts = {}  # (order, context) -> [rock, paper, scissors] counts
+        self.contexts = [0] * (max_order + 1)  # Current context of each order; order 0 is empty
+        self.rounds = 0
+
+    def update(self, player_choice, computer_choice):
+        """Count the player's move under every context it followed, then slide the contexts on."""
+        move = INDEX[player_choice]
+        for order in range(min(self.rounds, self.max_order) + 1):
+            key = (order, self.contexts[order])
+            counts = self.counts.get(key)
+            if counts is None:
+                counts = self.counts[key] = [0, 0, 0]
+            counts[move] += 1
+        symbol = move * len(CHOICES) + INDEX[computer_choice]
+        for order in range(self.max_order, 0, -1):
+            self.contexts[order] = self.contexts[order - 1] * ROUND_SYMBOLS + symbol
+        self.rounds += 1
+
+    def predict(self, max_order=None):
+        """Return the probability of each player move, backing off from long contexts to short ones."""
+        # Interpolated backoff: each order mixes its own counts with the next shorter
+        # order's estimate, trusting it more the more often its context has been seen
+        max_order = self.max_order if max_order is None else min(max_order, self.max_order)
+        probabilities = [1 / 3] * 3
+        for order in range(min(self.rounds, max_order) + 1):
+            counts = self.counts.get((order, self.contexts[order]))
+            if not counts:
+                break  # A context never seen has no longer extensions either
+            seen = counts[0] + counts[1] + counts[2]
+            weight = seen / (seen + len(CHOICES))
+            probabilities = [weight * count / seen + (1 - weight) * p for count, p in zip(counts, probabilities)]
+        return probabilities
+
+class AdaptiveOpponent:
+    def __init__(self, difficulty="Hard", seed=None):
+        """Play the move with the best expected result against the predicted player move."""
+        # Counts are always kept up to the longest context of any difficulty, so changing
+        # the difficulty mid-game keeps everything learned so far
+        self.random = random.Random(seed)
+        self.predictor = NGramPredictor(MAX_ORDER)
+        self.set_difficulty(difficulty)
+
+    def set_difficulty(self, difficulty):
+        """Change how far back the opponent looks and how often it plays at random."""
+        self.difficulty = difficulty
+        self.max_order, self.randomness = DIFFICULTIES[difficulty]
+
+    def choose(self):
+        """Return the computer's move."""
+        if self.random.random() < self.randomness:
+            return self.random.choice(CHOICES)
+        probabilities = self.predictor.predict(self.max_order)
+        # Expected result of playing c: P(player plays what c beats) - P(player plays what beats c)
+        best = max(range(3), key=lambda c: probabilities[INDEX[BEATS[CHOICES[c]]]] - probabilities[COUNTER[c]])
+        return CHOICES[best]
+
+    def observe(self, player_choice, computer_choice):
+        """Learn from a finished round."""
+        self.predictor.update(player_choice, computer_choice)
+
+# Scripted players for the benchmark, each a function of a random.Random and the (player, computer) history
+BOTS = {
+    "random": lambda rng, history: rng.choice(CHOICES),
+    "cycle": lambda rng, history: CHOICES[len(history) % 3],
+    "biased": lambda rng, history: "Rock" if rng.random() < 0.5 else rng.choice(CHOICES),
+    # Win-stay, lose-shift: repeat a winning move, otherwise play what would have won
+    "wsls": lambda rng, history: (rng.choice(CHOICES) if not history else history[-1][0]
+                                  if BEATS[history[-1][0]] == history[-1][1]
+                                  else CHOICES[COUNTER[INDEX[history[-1][1]]]]),
+}
+
+def benchmark(bot, difficulty="Hard", rounds=10000, seed=0):
+    """Play a scripted bot and return the computer's win, tie and loss rates and time per move."""
+    rng = random.Random(seed)
+    opponent = AdaptiveOpponent(difficulty, seed)
+    history = []
+    results = {"Computer": 0, "Tie": 0, "Player": 0}
+    elapsed = 0.0
+    for _ in range(rounds):
+        player_choice = BOTS[bot](rng, history)
+        start = time.perf_counter()
+        computer_choice = opponent.choose()
+        elapsed += time.perf_counter() - start
+        opponent.observe(player_choice, computer_choice)
+        history.append((player_choice, computer_choice))
+        results[determine_winner(player_choice, computer_choice)] += 1
+    return {key: count / rounds for key, count in results.items()} | {"move_us": elapsed / rounds * 1e6}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the adaptive Rock Paper Scissors opponent")
+    parser.add_argument("--difficulty", choices=list(DIFFICULTIES), default="Hard")
+    parser.add_argument("--rounds", type=int, default=10000)
+    args = parser.parse_args()
+
+    for bot in BOTS:
+        stats = benchmark(bot, args.difficulty, args.rounds)
+        print(f"vs {bot:<7} computer wins {stats['Computer']:.1%}  ties {stats['Tie']:.1%}  "
+              f"loses {stats['Player']:.1%}  ({stats['move_us']:.1f} us per move)")
@@ -0,0 +1,61 @@
+import random
+
+CHOICES = ["Rock", "Paper", "Scissors"]
+
+# Each choice and the choice it beats
+BEATS = {"Rock": "Scissors", "Paper": "Rock", "Scissors": "Paper"}
+
+def determine_winner(player_choice, computer_choice):
+    """Return "Player", "Computer" or "Tie" for one round."""
+    if player_choice == computer_choice:
+        return "Tie"
+    elif BEATS[player_choice] == computer_choice:
+        return "Player"
+    else:
+        return "Computer"
+
+class RockPaperScissorsEngine:
+    def __init__(self, winning_score=10, seed=None, opponent=None):
+        """Initialize the Rock Paper Scissors rules without any widgets."""
+        # opponent, such as rockpaperscissorai.AdaptiveOpponent, picks the computer's moves
+        # and is shown every finished round; without one the computer plays at random
+        self.winning_score = winning_score
+        self.random = random.Random(seed)
+        self.opponent = opponent
+        self.reset()
+
+    def reset(self):
+        """Reset the scores and the history."""
+        self.player_score = 0
+        self.computer_score = 0
+        self.rounds = 0
+        self.history = []  # (player choice, computer choice, result) for every round
+
+    def computer_choice(self):
+        """Pick the computer's move."""
+        if self.opponent is not None:
+            return self.opponent.choose()
+        return self.random.choice(CHOICES)
+
+    def play(self, player_choice):
+        """Play one round and return the computer's choice and the result."""
+        computer_choice = self.computer_choice()
+        result = determine_winner(player_choice, computer_choice)
+        if result == "Player":
+            self.player_score += 1
+        elif result == "Computer":
+            self.computer_score += 1
+        self.rounds += 1
+        self.history.append((player_choice, computer_choice, result))
+        if self.opponent is not None:
+            self.opponent.observe(player_choice, computer_choice)
+        return computer_choice, result
+
+    @property
+    def winner(self):
+        """Return "Player" or "Computer" once either reaches the winning score."""
+        if self.player_score >= self.winning_score:
+            return "Player"
+        if self.computer_score >= self.winning_score:
+            return "Computer"
+        return None
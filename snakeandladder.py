@@ -1,24 +1,92 @@
 import tkinter as tk
+import math
+import os
 import random
+import threading
+
+from canvashud import CanvasHud, CanvasItemMonitor
+from snakeladderboard import layout_digest, render_board
+from snakeladderengine import SnakeLadderEngine, load_layout, random_layout
+
+# The exact odds need NumPy; the game runs without them if it is missing
+try:
+    import snakeladdermarkov
+except ImportError:
+    snakeladdermarkov = None
+
+# Menu metadata, read by the game registry without importing this module
+GAME_INFO = {"title": "Snake and Ladder", "class": "SnakeLadderGame"}
+
+# Exact odds invert a dense (cells + 1)^2 matrix, so they are skipped on bigger boards
+MAX_ODDS_CELLS = 900
+MIN_BOARD_SIZE = 3
+
+PLAYER_COLORS = ["blue", "yellow", "red", "green", "purple", "orange", "cyan", "magenta"]
+
+# Rendered boards by layout digest, so reopening a board never draws it again
+BOARD_IMAGES = {}
+# Rendered boards are also kept here as PNG files, which skips rendering in later runs
+BOARD_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snakeladder_boards")
+
+def cached_board_image(master, digest, cache_dir=None):
+    """Return a rendered board from memory or the disk cache, or None if it has to be drawn."""
+    image = BOARD_IMAGES.get(digest)
+    if image is not None and image.tk is master.tk:
+        return image
+    path = os.path.join(cache_dir, f"snakeladder-{digest}.png") if cache_dir else None
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        image = tk.PhotoImage(master=master, file=path)
+    except tk.TclError:
+        return None  # Unreadable cache file: render it again
+    BOARD_IMAGES[digest] = image
+    return image
+
+def store_board_image(master, digest, data, cache_dir=None):
+    """Turn PPM data from render_board into a PhotoImage and keep it in both caches."""
+    image = tk.PhotoImage(master=master, data=data, format="ppm")
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            image.write(os.path.join(cache_dir, f"snakeladder-{digest}.png"), format="png")
+        except (OSError, tk.TclError):
+            pass  # The cache is only an optimization
+    BOARD_IMAGES[digest] = image
+    return image
 
 class SnakeLadderGame:
-    def __init__(self, root):
-        """Initialize the Snake and Ladder game."""
+    def __init__(self, root, layout_file=None, board_size=10, num_players=2, cell_size=None,
+                 cache_dir=BOARD_CACHE_DIR):
+        """Initialize the Snake and Ladder game for 2-8 players on an N x N board."""
+        # The classic layout is used on a 10x10 board, a random one on other sizes,
+        # and layout_file loads a board saved as JSON
+        if not 2 <= num_players <= len(PLAYER_COLORS):
+            raise ValueError(f"Snake and Ladder needs 2 to {len(PLAYER_COLORS)} players")
+        if not layout_file and board_size < MIN_BOARD_SIZE:
+            raise ValueError(f"Snake and Ladder needs a board of at least {MIN_BOARD_SIZE}x{MIN_BOARD_SIZE}")
         self.root = root
         self.root.title("Snake and Ladder")
         
-        self.board_size = 10
-        self.num_cells = self.board_size * self.board_size
-        self.snakes = {16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 64: 60, 87: 24, 93: 73, 95: 75, 98: 78}
-        self.ladders = {1: 38, 4: 14, 9: 31, 21: 42, 28: 84, 36: 44, 51: 67, 71: 91, 80: 100}
-        
-        self.player_positions = [0, 0]  # Starting positions for player 1 and player 2
-        self.turn = 0  # Player 1 starts first
-        self.dice_roll = 0  # Current dice roll
-        self.game_over = False
+        if layout_file:
+            board_size, snakes, ladders = load_layout(layout_file)
+        elif board_size != 10:
+            count = max(1, board_size * board_size // 10)
+            snakes, ladders = random_layout(board_size, count, count, min_length=min(3, board_size),
+                                            rng=random.Random(board_size))
+        else:
+            snakes = ladders = None
+        self.engine = SnakeLadderEngine(board_size, snakes, ladders, num_players)
+        self.board_size = self.engine.board_size
+        self.cell_size = cell_size or max(10, min(60, 600 // self.board_size))
+        self.cache_dir = cache_dir
+        self.snakes = self.engine.snakes
+        self.ladders = self.engine.ladders
+        self.odds = None  # Markov statistics, filled in by a background thread
         
         self.create_widgets()
         self.create_board()
+        self.start_odds()
 
     def create_widgets(self):
         """Create the main game widgets."""
@@ -52,47 +120,54 @@ class SnakeLadderGame:
                                          fg="green")
         self.message_label.pack(pady=10)
 
+        self.odds_label = tk.Label(self.root, text="", font=("Arial", 11), wraplength=600)
+        self.odds_label.pack()
+
     def create_board(self):
-        """Create the 10x10 game board."""
-        self.canvas = tk.Canvas(self.root, width=600, height=600)
+        """Create the game board."""
+        size = self.board_size * self.cell_size
+        self.canvas = tk.Canvas(self.root, width=size, height=size)
         self.canvas.pack()
 
-        # Draw the grid
-        cell_size = 60
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                x1 = col * cell_size
-                y1 = row * cell_size
-                x2 = x1 + cell_size
-                y2 = y1 + cell_size
-                self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", width=2)
-                
-                # Number the cells
-                cell_number = (self.board_size - row - 1) * self.board_size + col + 1
-                self.canvas.create_text(x1 + 30, y1 + 30, text=str(cell_number), font=("Arial", 12))
-
-        # Draw snakes and ladders
-        for start, end in self.snakes.items():
-            start_x, start_y = self.get_cell_coordinates(start)
-            end_x, end_y = self.get_cell_coordinates(end)
-            self.canvas.create_line(start_x + 30, start_y + 30, end_x + 30, end_y + 30, arrow=tk.LAST, fill="red", width=2)
-            self.canvas.create_text((start_x + end_x) // 2 + 30, (start_y + end_y) // 2 + 30, text="S", font=("Arial", 14, "bold"))
-
-        for start, end in self.ladders.items():
-            start_x, start_y = self.get_cell_coordinates(start)
-            end_x, end_y = self.get_cell_coordinates(end)
-            self.canvas.create_line(start_x + 30, start_y + 30, end_x + 30, end_y + 30, arrow=tk.FIRST, fill="green", width=2)
-            self.canvas.create_text((start_x + end_x) // 2 + 30, (start_y + end_y) // 2 + 30, text="L", font=("Arial", 14, "bold"))
-
-        # Draw player pieces
-        self.players = [
-            self.canvas.create_oval(15, 15, 45, 45, fill="blue"),
-            self.canvas.create_oval(15, 15, 45, 45, fill="yellow")
-        ]
+        # Cells, numbers, snakes and ladders are one cached image; only the player pieces
+        # are live items, moved in place, and the monitor warns if anything else is added
+        self.board_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self.board_items = 1
+        digest = layout_digest(self.board_size, self.snakes, self.ladders, self.cell_size)
+        self.board_image = cached_board_image(self.root, digest, self.cache_dir)
+        if self.board_image is not None:
+            self.canvas.itemconfig(self.board_item, image=self.board_image)
+        else:
+            self.start_board(digest)
+        self.hud = CanvasHud(self.canvas)
+        # Pieces share a cell in a grid of slots so every player stays visible
+        self.slots = math.ceil(math.sqrt(self.engine.num_players))
+        for player in range(self.engine.num_players):
+            self.update_player_position(player)
+        self.item_monitor = CanvasItemMonitor(self.canvas, "Snake and Ladder",
+                                              lambda: self.board_items + len(self.hud), tolerance=0)
+        self.item_monitor.start(self.root)
+
+    def start_board(self, digest):
+        """Render a new board in a thread; the pieces can be played while it is drawn."""
+        result = []
+        threading.Thread(target=lambda: result.append(
+            render_board(self.board_size, self.snakes, self.ladders, self.cell_size)), daemon=True).start()
+        self.root.after(20, self.finish_board, digest, result)
+
+    def finish_board(self, digest, result):
+        """Show the board once it has been rendered."""
+        if not self.root.winfo_exists():
+            return  # The window was closed first
+        if not result:
+            self.root.after(20, self.finish_board, digest, result)
+            return
+        self.board_image = store_board_image(self.root, digest, result[0], self.cache_dir)
+        self.canvas.itemconfig(self.board_item, image=self.board_image)
 
     def get_cell_coordinates(self, cell):
         """Get the (x, y) coordinates of a given cell."""
-        cell_size = 60
+        cell_size = self.cell_size
         row = (cell - 1) // self.board_size
         col = (cell - 1) % self.board_size
         x = col * cell_size
@@ -101,64 +176,101 @@ class SnakeLadderGame:
 
     def roll_dice(self):
         """Roll the dice and move the current player."""
-        if self.game_over:
+        player = self.engine.roll()
+        if player is None:
             return
-        self.dice_roll = random.randint(1, 6)
-        self.dice_label.config(text=f"Dice Roll: {self.dice_roll}")
-        
-        # Move the current player
-        new_position = self.player_positions[self.turn] + self.dice_roll
-        if new_position <= self.num_cells:
-            self.player_positions[self.turn] = new_position
-
-        # Check for snakes or ladders
-        if self.player_positions[self.turn] in self.snakes:
-            self.player_positions[self.turn] = self.snakes[self.player_positions[self.turn]]
+        self.dice_label.config(text=f"Dice Roll: {self.engine.dice_roll}")
+
+        if self.engine.last_event == "snake":
             self.message_label.config(text="Oops! You hit a snake.")
-        elif self.player_positions[self.turn] in self.ladders:
-            self.player_positions[self.turn] = self.ladders[self.player_positions[self.turn]]
+        elif self.engine.last_event == "ladder":
             self.message_label.config(text="Yay! You climbed a ladder.")
         else:
             self.message_label.config(text="")
 
         # Update the position of the player on the board
-        self.update_player_position()
+        self.update_player_position(player)
+
+        self.update_odds()
 
         # Check for winner
-        if self.player_positions[self.turn] == self.num_cells:
-            self.message_label.config(text=f"Player {self.turn + 1} wins!")
-            self.game_over = True
+        if self.engine.game_over:
+            self.message_label.config(text=f"Player {player + 1} wins!")
             return
 
-        # Switch turns
-        self.turn = (self.turn + 1) % 2
-        self.turn_label.config(text=f"Player {self.turn + 1}'s turn")
+        self.turn_label.config(text=f"Player {self.engine.turn + 1}'s turn")
 
-    def update_player_position(self):
-        """Update the position of the players on the board."""
-        player_oval = self.players[self.turn]
-        x, y = self.get_cell_coordinates(self.player_positions[self.turn])
-        self.canvas.coords(player_oval, x + 15, y + 15, x + 45, y + 45)
+    def update_player_position(self, player):
+        """Update the position of a player on the board."""
+        position = self.engine.player_positions[player]
+        # Players who have not moved yet wait in the top-left corner
+        x, y = self.get_cell_coordinates(position) if position else (0, 0)
+        slot = self.cell_size / self.slots
+        row, col = divmod(player, self.slots)
+        x += col * slot + slot * 0.1
+        y += row * slot + slot * 0.1
+        self.hud.shape(f"player{player}", "oval", (x, y, x + slot * 0.8, y + slot * 0.8),
+                       fill=PLAYER_COLORS[player])
+
+    def update_odds(self):
+        """Show the exact expected game length and each player's expected rolls to finish."""
+        if self.odds is None:
+            return  # Not worked out (yet)
+        stats = self.odds
+        remaining = "  ".join(f"P{player + 1}: {stats['expected_turns_from'][position]:.1f}"
+                              for player, position in enumerate(self.engine.player_positions))
+        self.odds_label.config(text=f"A game takes {stats['expected_turns']:.1f} rolls on average "
+                                    f"(median {stats['median_turns']}). Rolls left - {remaining}")
+
+    def start_odds(self):
+        """Analyze the layout in a thread so a big board does not hold up the window."""
+        if snakeladdermarkov is None or self.board_size ** 2 > MAX_ODDS_CELLS:
+            return
+        self.odds_label.config(text="Working out the odds...")
+        result = []
+        threading.Thread(target=lambda: result.append(
+            snakeladdermarkov.analyze(self.board_size, self.snakes, self.ladders)), daemon=True).start()
+        self.root.after(50, self.finish_odds, result)
+
+    def finish_odds(self, result):
+        """Show the odds once the analysis has finished."""
+        if not self.root.winfo_exists():
+            return  # The window was closed first
+        if not result:
+            self.root.after(50, self.finish_odds, result)
+            return
+        self.odds = result[0]
+        self.update_odds()
 
     def reset_game(self):
         """Reset the game to its initial state."""
-        self.game_over = False
-        self.player_positions = [0, 0]
-        self.turn = 0
-        self.dice_roll = 0
+        self.engine.reset()
         self.dice_label.config(text="Dice Roll: 0")
         self.turn_label.config(text="Player 1's turn")
         self.message_label.config(text="")
+        self.update_odds()
         
         # Reset player positions
-        for player_oval in self.players:
-            self.canvas.coords(player_oval, 15, 15, 45, 45)
+        for player in range(self.engine.num_players):
+            self.update_player_position(player)
 
     def exit_game(self):
         """Exit the game."""
-        self.root.quit()
+        self.root.destroy()
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Snake and Ladder")
+    parser.add_argument("--layout", metavar="FILE", help="board saved by snakeladdergen.py --out")
+    parser.add_argument("--board-size", type=int, default=10, help="cells per side (ignored with --layout)")
+    parser.add_argument("--players", type=int, default=2, help="2 to 8 players")
+    parser.add_argument("--cell-size", type=int, default=None, help="pixels per cell")
+    parser.add_argument("--board-cache", metavar="DIR", default=BOARD_CACHE_DIR,
+                        help="keep rendered boards here as PNG files (default: %(default)s)")
+    parser.add_argument("--no-board-cache", action="store_true", help="always render the board")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    game = SnakeLadderGame(root)
+    game = SnakeLadderGame(root, layout_file=args.layout, board_size=args.board_size, num_players=args.players,
+                           cell_size=args.cell_size, cache_dir=None if args.no_board_cache else args.board_cache)
     root.mainloop()
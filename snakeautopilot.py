@@ -0,0 +1,256 @@
+import argparse
+import heapq
+import multiprocessing
+import os
+import time
+from collections import deque
+
+from snakeengine import OPPOSITES, SnakeEngine
+
+def neighbours(index, size):
+    """Yield (direction, cell index) for the cells next to a cell index."""
+    y, x = divmod(index, size)
+    if x > 0:
+        yield "Left", index - 1
+    if x < size - 1:
+        yield "Right", index + 1
+    if y > 0:
+        yield "Up", index - size
+    if y < size - 1:
+        yield "Down", index + size
+
+def direction_to(start, target, size):
+    """Return the direction of a neighbouring cell."""
+    for direction, cell in neighbours(start, size):
+        if cell == target:
+            return direction
+    return None
+
+def trace_path(parents, start, goal):
+    """Follow parent links back from goal and return the path without the start cell."""
+    path = []
+    cell = goal
+    while cell != start:
+        path.append(cell)
+        cell = parents[cell]
+    path.reverse()
+    return path
+
+def bfs_path(size, blocked, start, goal):
+    """Return the shortest path of cell indices from start to goal, or None."""
+    parents = {start: start}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        if cell == goal:
+            return trace_path(parents, start, goal)
+        for _, nxt in neighbours(cell, size):
+            if nxt not in parents and (not blocked[nxt] or nxt == goal):
+                parents[nxt] = cell
+                queue.append(nxt)
+    return None
+
+def astar_path(size, blocked, start, goal):
+    """Return a shortest path from start to goal using A* with the Manhattan distance."""
+    goal_y, goal_x = divmod(goal, size)
+
+    def distance(cell):
+        y, x = divmod(cell, size)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    parents = {start: start}
+    cost = {start: 0}
+    heap = [(distance(start), 0, start)]
+    while heap:
+        _, steps, cell = heapq.heappop(heap)
+        if cell == goal:
+            return trace_path(parents, start, goal)
+        if steps > cost[cell]:
+            continue
+        for _, nxt in neighbours(cell, size):
+            if blocked[nxt] and nxt != goal:
+                continue
+            if steps + 1 < cost.get(nxt, steps + 2):
+                cost[nxt] = steps + 1
+                parents[nxt] = cell
+                heapq.heappush(heap, (steps + 1 + distance(nxt), steps + 1, nxt))
+    return None
+
+def flood_size(size, blocked, start):
+    """Count the free cells reachable from start."""
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        for _, nxt in neighbours(cell, size):
+            if nxt not in seen and not blocked[nxt]:
+                seen.add(nxt)
+                queue.append(nxt)
+    return len(seen)
+
+def body_indices(engine):
+    """Return the snake's cell indices, head first."""
+    size = engine.board_size
+    return [y * size + x for x, y in engine.snake]
+
+def safest_direction(engine):
+    """Pick the legal move with the most room behind it."""
+    size = engine.board_size
+    head = body_indices(engine)[0]
+    best = None
+    best_room = -1
+    for direction, cell in neighbours(head, size):
+        if engine.occupied[cell] or direction == OPPOSITES[engine.direction]:
+            continue
+        room = flood_size(size, engine.occupied, cell)
+        if room > best_room:
+            best, best_room = direction, room
+    return best or engine.direction
+
+class GreedyBFSAgent:
+    def __init__(self, board_size):
+        """Follow the shortest path to the food."""
+        self.board_size = board_size
+
+    def choose(self, engine):
+        size = engine.board_size
+        head = body_indices(engine)[0]
+        food = engine.food[1] * size + engine.food[0]
+        path = bfs_path(size, engine.occupied, head, food)
+        if path:
+            return direction_to(head, path[0], size)
+        return safest_direction(engine)
+
+class AStarAgent:
+    def __init__(self, board_size):
+        """Take the A* path to the food only if the tail is still reachable afterwards."""
+        self.board_size = board_size
+
+    def choose(self, engine):
+        size = engine.board_size
+        body = body_indices(engine)
+        head = body[0]
+        food = engine.food[1] * size + engine.food[0]
+        path = astar_path(size, engine.occupied, head, food)
+        if path and self.tail_reachable_after(body, path, size):
+            return direction_to(head, path[0], size)
+
+        # No safe way to the food yet: chase the tail, which keeps space open
+        if len(body) > 1:
+            tail_path = bfs_path(size, engine.occupied, head, body[-1])
+            if tail_path and len(tail_path) > 1:
+                return direction_to(head, tail_path[0], size)
+        return safest_direction(engine)
+
+    def tail_reachable_after(self, body, path, size):
+        """Check that after eating at the end of the path the head can still reach the tail."""
+        # The snake after following the path, tail first; it is one longer for the food
+        cells = list(reversed(body)) + path
+        new_body = cells[-(len(body) + 1):]
+        blocked = bytearray(size * size)
+        for cell in new_body:
+            blocked[cell] = 1
+        if len(new_body) >= size * size:
+            return True  # The food was the last free cell
+        tail_path = bfs_path(size, blocked, new_body[-1], new_body[0])
+        return tail_path is not None and len(tail_path) > 1
+
+class HamiltonianAgent:
+    def __init__(self, board_size):
+        """Follow a cycle through every cell, which can never crash; needs an even board size."""
+        self.board_size = board_size
+        self.fallback = AStarAgent(board_size)
+        self.cycle = None
+        if board_size % 2 == 0:
+            self.cycle = self.build_cycle(board_size)
+        self.next_cell = None
+
+    @staticmethod
+    def build_cycle(size):
+        """Return the cells of a serpentine cycle that comes back up the first column."""
+        order = []
+        for y in range(size):
+            xs = range(1, size) if y % 2 == 0 else range(size - 1, 0, -1)
+            order.extend(y * size + x for x in xs)
+        order.extend(y * size for y in range(size - 1, -1, -1))
+        return order
+
+    def orient(self, body):
+        """Pick the cycle direction the snake's body already follows, if any."""
+        for order in (self.cycle, self.cycle[::-1]):
+            next_cell = [0] * len(order)
+            for i, cell in enumerate(order):
+                next_cell[cell] = order[(i + 1) % len(order)]
+            if all(next_cell[body[i + 1]] == body[i] for i in range(len(body) - 1)):
+                return next_cell
+        return None
+
+    def choose(self, engine):
+        if self.cycle is None:
+            return self.fallback.choose(engine)
+        body = body_indices(engine)
+        if self.next_cell is None or (len(body) > 1 and self.next_cell[body[1]] != body[0]):
+            self.next_cell = self.orient(body)
+        if self.next_cell is None:
+            return self.fallback.choose(engine)
+        return direction_to(body[0], self.next_cell[body[0]], engine.board_size)
+
+AGENTS = {"greedy": GreedyBFSAgent, "astar": AStarAgent, "hamiltonian": HamiltonianAgent}
+
+def play_game(agent_name, board_size=20, seed=None):
+    """Play one headless game and return (score, steps, seconds spent deciding, won)."""
+    engine = SnakeEngine(board_size, seed)
+    agent = AGENTS[agent_name](board_size)
+    decision_time = 0.0
+    # Give up on a game that goes twice round the board without eating
+    patience = 2 * board_size * board_size
+    since_food = 0
+    while not engine.game_over and since_food < patience:
+        start = time.perf_counter()
+        direction = agent.choose(engine)
+        decision_time += time.perf_counter() - start
+        engine.change_direction(direction)
+        since_food = 0 if engine.step() in ("ate", "won") else since_food + 1
+    return engine.score, engine.ticks, decision_time, engine.won
+
+def _play_job(job):
+    return play_game(*job)
+
+def benchmark(agent_name, games=1000, board_size=20, workers=None, seed=0):
+    """Play seeded games across processes and return score and speed statistics."""
+    workers = workers or os.cpu_count() or 1
+    jobs = [(agent_name, board_size, seed + i) for i in range(games)]
+    start = time.perf_counter()
+    if workers == 1:
+        results = list(map(_play_job, jobs))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(_play_job, jobs, chunksize=max(1, games // (workers * 8)))
+    elapsed = time.perf_counter() - start
+
+    scores = [score for score, _, _, _ in results]
+    steps = sum(steps for _, steps, _, _ in results)
+    decision_time = sum(seconds for _, _, seconds, _ in results)
+    return {
+        "games": games,
+        "mean_score": sum(scores) / games,
+        "max_score": max(scores),
+        "wins": sum(1 for *_, won in results if won),
+        "steps_per_second": steps / elapsed,
+        "decision_us": decision_time / steps * 1e6 if steps else 0.0,
+        "seconds": elapsed,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Snake autopilot benchmark")
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="astar")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--board-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stats = benchmark(args.agent, args.games, args.board_size, args.workers, args.seed)
+    print(f"{stats['games']} games with the {args.agent} agent on a {args.board_size}x{args.board_size} board")
+    print(f"Mean score: {stats['mean_score']:.1f}  Max: {stats['max_score']}  Board cleared: {stats['wins']}")
+    print(f"Steps/sec: {stats['steps_per_second']:,.0f}  Time per decision: {stats['decision_us']:.1f} us")
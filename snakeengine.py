@@ -0,0 +1,111 @@
+import random
+from collections import deque
+
+# Head offset for each direction key
+DIRECTIONS = {"Left": (-1, 0), "Right": (1, 0), "Up": (0, -1), "Down": (0, 1)}
+OPPOSITES = {"Left": "Right", "Right": "Left", "Up": "Down", "Down": "Up"}
+
+# The snake starts at (3..5, 5) heading right, which needs a couple of cells of room
+MIN_BOARD_SIZE = 8
+
+class SnakeEngine:
+    def __init__(self, board_size=20, seed=None):
+        """Initialize the Snake rules without any widgets."""
+        if board_size < MIN_BOARD_SIZE:
+            raise ValueError(f"Snake needs a board of at least {MIN_BOARD_SIZE}x{MIN_BOARD_SIZE}")
+        self.board_size = board_size
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new game, optionally with a fixed random seed."""
+        # Every game has a known seed so it can be replayed from its turns alone
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.random = random.Random(self.seed)
+        self.snake = deque([(5, 5), (4, 5), (3, 5)])  # Initial snake position, head first
+        cells = self.board_size * self.board_size
+        # One byte per cell, set while the snake covers it
+        self.occupied = bytearray(cells)
+        # Every cell the snake does not cover, and each cell's index in that list (-1 if covered)
+        self.free = list(range(cells))
+        self.free_index = list(range(cells))
+        for x, y in self.snake:
+            self.take_cell(y * self.board_size + x)
+        self.vacated = None  # Cell the tail left on the last tick, None if the snake grew
+        self.direction = 'Right'
+        self.game_over = False
+        self.won = False
+        self.score = 0
+        self.ticks = 0
+        self.turns = []  # (tick, direction) for every change of direction
+        self.create_food()
+
+    def change_direction(self, direction):
+        """Turn the snake unless that would reverse it. Return True if it turned."""
+        if direction not in DIRECTIONS or OPPOSITES[direction] == self.direction:
+            return False
+        if direction != self.direction:
+            self.turns.append((self.ticks, direction))
+            self.direction = direction
+        return True
+
+    def take_cell(self, index):
+        """Mark a cell as covered by the snake, swap-removing it from the free list."""
+        self.occupied[index] = 1
+        position = self.free_index[index]
+        last = self.free.pop()
+        if last != index:
+            self.free[position] = last
+            self.free_index[last] = position
+        self.free_index[index] = -1
+
+    def release_cell(self, index):
+        """Mark a cell as free again."""
+        self.occupied[index] = 0
+        self.free_index[index] = len(self.free)
+        self.free.append(index)
+
+    def create_food(self):
+        """Place the food on a random free cell, or return False if the board is full."""
+        if not self.free:
+            self.food = None
+            return False
+        y, x = divmod(self.free[self.random.randrange(len(self.free))], self.board_size)
+        self.food = (x, y)
+        return True
+
+    def is_occupied(self, cell):
+        """Return True if the snake covers the cell."""
+        return self.occupied[cell[1] * self.board_size + cell[0]] == 1
+
+    def step(self):
+        """Advance the snake by one cell and return "dead", "ate", "won" or "moved"."""
+        self.ticks += 1
+        dx, dy = DIRECTIONS[self.direction]
+        head_x, head_y = self.snake[0]
+        new_head = (head_x + dx, head_y + dy)
+
+        # Check for collision with the wall or itself (the tail has not moved yet)
+        if (new_head[0] < 0 or new_head[0] >= self.board_size or
+            new_head[1] < 0 or new_head[1] >= self.board_size or
+            self.is_occupied(new_head)):
+            self.game_over = True
+            return "dead"
+
+        # Eating keeps the tail in place, so the snake grows by one
+        if new_head == self.food:
+            self.vacated = None
+        else:
+            self.vacated = tail = self.snake.pop()
+            self.release_cell(tail[1] * self.board_size + tail[0])
+        self.snake.appendleft(new_head)
+        self.take_cell(new_head[1] * self.board_size + new_head[0])
+
+        if self.vacated is None:
+            self.score += 1
+            if not self.create_food():
+                # The snake fills the whole board
+                self.game_over = True
+                self.won = True
+                return "won"
+            return "ate"
+        return "moved"
@@ -1,21 +1,137 @@
 import tkinter as tk
-import random
+from collections import deque
+import os
+import time
+
+from canvashud import CanvasHud, CanvasItemMonitor, ItemPool
+from gameloop import FixedTimestepLoop
+from snakeautopilot import AGENTS
+from snakeengine import MIN_BOARD_SIZE, SnakeEngine
+import snakereplay
+
+# Menu metadata, read by the game registry without importing this module
+GAME_INFO = {"title": "Snake Game", "class": "SnakeGame"}
+
+# Tick period in seconds; every SPEED_STEP points the game gets 10% faster, down to MIN_INTERVAL
+BASE_INTERVAL = 0.1
+MIN_INTERVAL = 0.04
+SPEED_STEP = 5
+
+# Boards wider than this use the pixel-buffer renderer unless another one is chosen
+PIXEL_RENDERER_BOARD_SIZE = 60
+
+class CanvasSnakeRenderer:
+    def __init__(self, canvas, cell_size):
+        """Draw the snake with one reusable rectangle per segment."""
+        self.canvas = canvas
+        self.cell_size = cell_size
+        # Segment rectangles come from a pool, so a restart reuses them instead of recreating them
+        self.pool = ItemPool(canvas, "rectangle", fill="green", outline="black", tags="snake")
+        self.items = deque()  # Canvas items in snake order, head first
+        self.food_item = None
+
+    def cell_box(self, cell):
+        """Return the canvas rectangle of a board cell."""
+        x, y = cell
+        return (x * self.cell_size, y * self.cell_size,
+                (x + 1) * self.cell_size, (y + 1) * self.cell_size)
+
+    def reset(self, engine):
+        """Draw the whole snake and the food from scratch."""
+        for item in self.items:
+            self.pool.release(item)
+        self.items = deque(self.pool.acquire(*self.cell_box(segment)) for segment in engine.snake)
+        if self.food_item is None:
+            self.food_item = self.canvas.create_rectangle(*self.cell_box(engine.food),
+                                                          fill="red", outline="black", tags="food")
+        else:
+            self.canvas.coords(self.food_item, *self.cell_box(engine.food))
+            self.canvas.itemconfig(self.food_item, state="normal")
+
+    def item_count(self):
+        """Return how many canvas items the renderer owns."""
+        return len(self.pool) + (self.food_item is not None)
+
+    def apply(self, event, head, vacated, food):
+        """Draw one tick's change with a constant number of canvas calls."""
+        if event == "dead":
+            return
+        if vacated is None:
+            # The snake grew: one new item for the head
+            self.items.appendleft(self.pool.acquire(*self.cell_box(head)))
+            if food is None:
+                self.canvas.itemconfig(self.food_item, state="hidden")
+            else:
+                self.canvas.coords(self.food_item, *self.cell_box(food))
+        else:
+            # The old tail becomes the new head
+            item = self.items.pop()
+            self.canvas.coords(item, *self.cell_box(head))
+            self.items.appendleft(item)
+
+class PixelSnakeRenderer:
+    def __init__(self, canvas, board_size, cell_size):
+        """Draw the board into one PhotoImage so the canvas item count never grows."""
+        self.canvas = canvas
+        self.cell_size = cell_size
+        self.size = board_size * cell_size
+        self.image = tk.PhotoImage(width=self.size, height=self.size)
+        # Leave a 1px black border round each cell when cells are big enough to show it
+        self.inset = 1 if cell_size >= 4 else 0
+        self.image_item = None
+
+    def fill_cell(self, cell, color):
+        """Write one cell's dirty rectangle into the pixel buffer."""
+        x, y = cell
+        inset = self.inset if color != "black" else 0
+        self.image.put(color, to=(x * self.cell_size + inset, y * self.cell_size + inset,
+                                  (x + 1) * self.cell_size - inset, (y + 1) * self.cell_size - inset))
+
+    def reset(self, engine):
+        """Clear the buffer and draw the whole snake and the food."""
+        self.image.put("black", to=(0, 0, self.size, self.size))
+        for segment in engine.snake:
+            self.fill_cell(segment, "green")
+        self.fill_cell(engine.food, "red")
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(0, 0, image=self.image, anchor=tk.NW, tags="board")
+            self.canvas.tag_lower("board")
+
+    def item_count(self):
+        """Return how many canvas items the renderer owns."""
+        return 1
+
+    def apply(self, event, head, vacated, food):
+        """Write only the cells that changed on one tick."""
+        if event == "dead":
+            return
+        if vacated is not None:
+            self.fill_cell(vacated, "black")
+        self.fill_cell(head, "green")
+        if vacated is None and food is not None:
+            self.fill_cell(food, "red")
 
 class SnakeGame:
-    def __init__(self, root):
-        """Initialize the Snake game."""
+    def __init__(self, root, board_size=20, cell_size=None, renderer=None,
+                 record_dir=None, replay=None, replay_speed=4.0):
+        """Initialize the Snake game; renderer is "canvas", "pixel" or None to pick by board size."""
         self.root = root
         self.root.title("Snake Game")
         self.root.resizable(False, False)
+
+        # Finished games are saved to record_dir; a replay file is played back instead of a live game
+        self.record_dir = record_dir
+        self.replay_log = snakereplay.load(replay) if replay else None
+        self.speed = replay_speed if self.replay_log else 1.0
+        if self.replay_log:
+            board_size = self.replay_log["board_size"]
         
         # Game Variables
-        self.board_size = 20
-        self.cell_size = 20
-        self.snake = [(5, 5), (4, 5), (3, 5)]  # Initial snake position
-        self.food = None
-        self.direction = 'Right'
-        self.game_over = False
-        self.score = 0
+        self.board_size = board_size
+        # Big boards get smaller cells so the window stays about 800 pixels at most
+        self.cell_size = cell_size or min(20, max(2, 800 // self.board_size))
+        self.engine = SnakeEngine(self.board_size)
+        self.start_replay()
         
         # Create canvas
         self.canvas = tk.Canvas(self.root, width=self.board_size * self.cell_size,
@@ -24,116 +140,146 @@ class SnakeGame:
         self.canvas.pack()
 
         # Draw initial snake and food
-        self.create_food()
-        self.draw_snake()
+        if renderer is None:
+            renderer = "pixel" if board_size > PIXEL_RENDERER_BOARD_SIZE else "canvas"
+        if renderer == "pixel":
+            self.renderer = PixelSnakeRenderer(self.canvas, self.board_size, self.cell_size)
+        else:
+            self.renderer = CanvasSnakeRenderer(self.canvas, self.cell_size)
+        self.renderer.reset(self.engine)
 
-        # Bind keys for controlling the snake
+        # Score and end-of-game text are persistent items updated in place; the monitor
+        # warns if the canvas ever holds more items than the renderer and HUD account for
+        self.hud = CanvasHud(self.canvas)
+        self.show_score()
+        self.item_monitor = CanvasItemMonitor(self.canvas, "Snake Game",
+                                              lambda: self.renderer.item_count() + len(self.hud))
+        self.item_monitor.start(self.root)
+
+        # Bind keys for controlling the snake, A to toggle the autopilot and F2 to print the loop timings
+        self.autopilot = None
         self.root.bind("<KeyPress>", self.change_direction)
+        self.root.bind("<KeyPress-a>", self.toggle_autopilot)
+        self.root.bind("<F2>", self.print_stats)
+
+        # Start the game loop; logic ticks run on a fixed timestep, drawing once per frame
+        self.pending = []  # Tick changes that have not been drawn yet
+        self.loop = FixedTimestepLoop(self.root, self.tick, self.render, interval=self.tick_interval())
+        self.loop.start()
 
-        # Start the game loop
-        self.update_game()
-
-    def create_food(self):
-        """Create a new food item at a random location."""
-        self.food = (random.randint(0, self.board_size - 1), random.randint(0, self.board_size - 1))
-        while self.food in self.snake:  # Ensure the food is not on the snake
-            self.food = (random.randint(0, self.board_size - 1),
-                          random.randint(0, self.board_size - 1))
-        self.canvas.create_rectangle(self.food[0] * self.cell_size,
-                                      self.food[1] * self.cell_size,
-                                     (self.food[0] + 1) * self.cell_size,
-                                       (self.food[1] + 1) * self.cell_size,
-                                     fill="red",
-                                      
-                                       outline="black")
-
-    def draw_snake(self):
-        """Draw the snake on the canvas."""
-        self.canvas.delete("snake")  # Clear the previous snake
-        for segment in self.snake:
-            self.canvas.create_rectangle(segment[0] * self.cell_size, segment[1] * self.cell_size,
-                                         (segment[0] + 1) * self.cell_size,
-                                           (segment[1] + 1) * self.cell_size,
-                                         fill="green", outline="black",
-                                           tags="snake")
+    def start_replay(self):
+        """Restart the engine from the replay's seed when playing a replay back."""
+        self.replay_cursor = None
+        if self.replay_log:
+            self.engine.reset(self.replay_log["seed"])
+            self.replay_cursor = snakereplay.ReplayCursor(self.replay_log["turns"])
+            self.root.title("Snake Game (replay)")
 
     def change_direction(self, event):
         """Change the direction of the snake based on the key press."""
-        if event.keysym == 'Left' and self.direction != 'Right':
-            self.direction = 'Left'
-        elif event.keysym == 'Right' and self.direction != 'Left':
-            self.direction = 'Right'
-        elif event.keysym == 'Up' and self.direction != 'Down':
-            self.direction = 'Up'
-        elif event.keysym == 'Down' and self.direction != 'Up':
-            self.direction = 'Down'
-
-    def move_snake(self):
-        """Move the snake in the current direction."""
-        head_x, head_y = self.snake[0]
-        if self.direction == 'Left':
-            head_x -= 1
-        elif self.direction == 'Right':
-            head_x += 1
-        elif self.direction == 'Up':
-            head_y -= 1
-        elif self.direction == 'Down':
-            head_y += 1
-
-        new_head = (head_x, head_y)
-
-        # Check for collision with the wall or itself
-        if (new_head[0] < 0 or new_head[0] >= self.board_size or
-            new_head[1] < 0 or new_head[1] >= self.board_size or
-            new_head in self.snake):
-            self.game_over = True
-            return
+        if self.replay_cursor is None:
+            self.engine.change_direction(event.keysym)
+
+    def save_replay(self):
+        """Save the finished game to the record directory."""
+        os.makedirs(self.record_dir, exist_ok=True)
+        name = f"snake-{time.strftime('%Y%m%d-%H%M%S')}-{self.engine.seed}.snk"
+        snakereplay.save(self.engine, os.path.join(self.record_dir, name))
+
+    def toggle_autopilot(self, event=None, agent="astar"):
+        """Hand the live game to an autopilot agent, or take it back."""
+        if self.autopilot is None:
+            self.autopilot = AGENTS[agent](self.board_size)
+            self.root.title("Snake Game (autopilot)")
+        else:
+            self.autopilot = None
+            self.root.title("Snake Game")
+
+    def tick_interval(self):
+        """Return the tick period for the current score."""
+        level = self.engine.score // SPEED_STEP
+        return max(MIN_INTERVAL, BASE_INTERVAL * 0.9 ** level) / self.speed
 
-        # Add the new head to the snake
-        self.snake = [new_head] + self.snake[:-1]
-
-        # Check if the snake eats food
-        if new_head == self.food:
-            self.snake.append(self.snake[-1])  # Add a new segment to the snake
-            self.score += 1
-            self.create_food()  # Create a new food item
-            self.canvas.create_text(self.board_size * self.cell_size / 2, 10,
-                                    text=f"Score: {self.score}",
-                                      fill="white", font=("Arial", 14))
-
-    def update_game(self):
-        """Update the game state and redraw the screen."""
-        if self.game_over:
-            self.canvas.create_text(self.board_size * self.cell_size / 2, 
-                                    self.board_size * self.cell_size / 2,
-                                    text="Game Over! Press R to Restart",
-                                      fill="white", font=("Arial", 16))
+    def tick(self):
+        """Move the snake one step. Return False once the game is over."""
+        if self.replay_cursor is not None:
+            if self.engine.ticks >= self.replay_log["ticks"]:
+                return False
+            self.replay_cursor.apply(self.engine)
+        elif self.autopilot is not None:
+            self.engine.change_direction(self.autopilot.choose(self.engine))
+        event = self.engine.step()
+        self.pending.append((event, self.engine.snake[0], self.engine.vacated, self.engine.food))
+        if event == "ate":
+            self.loop.set_interval(self.tick_interval())
+        return not self.engine.game_over
+
+    def render(self):
+        """Draw the changes from the ticks since the last frame."""
+        ate = False
+        for change in self.pending:
+            self.renderer.apply(*change)
+            ate = ate or change[0] in ("ate", "won")
+        self.pending.clear()
+        if ate:
+            self.show_score()
+
+        if self.engine.game_over:
+            message = "You Win! Press R to Restart" if self.engine.won else "Game Over! Press R to Restart"
+            self.hud.text("message", self.board_size * self.cell_size / 2,
+                          self.board_size * self.cell_size / 2,
+                          message, fill="white", font=("Arial", 16))
+            self.hud.raise_above()
             self.root.bind("<KeyPress-r>", self.restart_game)
-            return
-        
-        # Move the snake and redraw the board
-        self.move_snake()
-        self.draw_snake()
+            if self.record_dir and self.replay_cursor is None:
+                self.save_replay()
 
-        # Set the update interval for the game loop (e.g., 100 milliseconds)
-        self.root.after(100, self.update_game)
+    def show_score(self):
+        """Update the score text and keep it above the snake."""
+        self.hud.text("score", self.board_size * self.cell_size / 2, 10,
+                      f"Score: {self.engine.score}", fill="white", font=("Arial", 14))
+        self.hud.raise_above()
+
+    def print_stats(self, event=None):
+        """Print the frame-time, tick-jitter and canvas item summaries."""
+        stats = self.loop.stats()
+        for name in ("frame_times", "tick_jitter"):
+            summary = stats[name]
+            print(f"{name}: n={summary['count']} mean={summary['mean']:.2f}ms "
+                  f"p95={summary['p95']:.1f}ms max={summary['max']:.2f}ms")
+        print(f"interval={stats['interval'] * 1000:.0f}ms skipped_ticks={stats['skipped_ticks']}")
+        live, expected = self.item_monitor.check()
+        print(f"canvas_items={live} expected={expected}")
 
     def restart_game(self, event):
         """Restart the game when the player presses the 'R' key."""
-        self.snake = [(5, 5), (4, 5), (3, 5)]  
-        # Reset snake position
-        self.direction = 'Right'
-        self.game_over = False
-        self.score = 0
-        self.canvas.delete("all")  
-        # Clear the canvas
-        self.create_food() 
-         # Create initial food
-        self.draw_snake()  
-        # Draw initial snake
-        self.update_game()
+        if not self.engine.game_over:
+            return
+        self.engine.reset()
+        self.start_replay()
+        # Redraw the snake and food with the existing items and hide the end-of-game text
+        self.renderer.reset(self.engine)
+        self.hud.hide("message")
+        self.show_score()
+        self.pending.clear()
+        self.loop.set_interval(self.tick_interval())
+        self.loop.start()
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Snake Game")
+    parser.add_argument("--board-size", type=int, default=20, help=f"cells per side (at least {MIN_BOARD_SIZE})")
+    parser.add_argument("--cell-size", type=int, default=None, help="pixels per cell (default: by board size)")
+    parser.add_argument("--renderer", choices=["canvas", "pixel"], default=None,
+                        help="canvas items per segment, or one pixel buffer (default: by board size)")
+    parser.add_argument("--record", metavar="DIR", help="save a replay of every finished game here")
+    parser.add_argument("--replay", metavar="FILE", help="play a saved replay back")
+    parser.add_argument("--speed", type=float, default=4.0, help="replay speed multiplier")
+    args = parser.parse_args()
+    if args.board_size < MIN_BOARD_SIZE:
+        parser.error(f"--board-size must be at least {MIN_BOARD_SIZE}")
+
     root = tk.Tk()
-    game = SnakeGame(root)
+    game = SnakeGame(root, board_size=args.board_size, cell_size=args.cell_size, renderer=args.renderer,
+                     record_dir=args.record, replay=args.replay, replay_speed=args.speed)
     root.mainloop()
@@ -0,0 +1,169 @@
+import hashlib
+
+from snakeladderengine import LADDERS, SNAKES
+
+# The raster uses NumPy when it is installed and falls back to a bytearray
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 3x5 pixel digits, one string of rows per digit
+DIGITS = {
+    "0": ("111", "101", "101", "101", "111"), "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"), "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"), "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"), "7": ("111", "001", "010", "010", "010"),
+    "8": ("111", "101", "111", "101", "111"), "9": ("111", "101", "111", "001", "111"),
+}
+
+LIGHT = (245, 240, 220)
+DARK = (232, 222, 192)
+GRID = (0, 0, 0)
+NUMBER = (90, 90, 90)
+SNAKE = (200, 30, 30)
+LADDER = (40, 150, 40)
+
+# Bump when the drawing changes so stale images in the disk cache are not reused
+RENDER_VERSION = 1
+
+def layout_digest(board_size, snakes, ladders, cell_size):
+    """Return a short hash that names a rendered board in caches."""
+    key = repr((RENDER_VERSION, board_size, sorted(snakes.items()), sorted(ladders.items()), cell_size))
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+class BoardRaster:
+    def __init__(self, board_size, cell_size):
+        """An RGB pixel buffer with the few drawing operations the board needs."""
+        self.board_size = board_size
+        self.cell_size = cell_size
+        self.size = board_size * cell_size
+        if np is not None:
+            self.pixels = np.zeros((self.size, self.size, 3), dtype=np.uint8)
+            self.pending = []  # Lines of one color, drawn together by flush()
+        else:
+            self.pixels = bytearray(self.size * self.size * 3)
+
+    def fill(self, x1, y1, x2, y2, color):
+        """Fill the rectangle [x1, x2) x [y1, y2), clipped to the buffer."""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.size, x2), min(self.size, y2)
+        if x1 >= x2 or y1 >= y2:
+            return
+        if np is not None:
+            self.flush()
+            self.pixels[y1:y2, x1:x2] = color
+            return
+        row = bytes(color) * (x2 - x1)
+        for y in range(y1, y2):
+            start = (y * self.size + x1) * 3
+            self.pixels[start:start + len(row)] = row
+
+    def line(self, x1, y1, x2, y2, width, color):
+        """Draw a thick straight line by stamping squares along it."""
+        if np is not None:
+            if self.pending and self.pending[-1][5] != color:
+                self.flush()
+            self.pending.append((x1, y1, x2, y2, width, color))
+            return
+        steps = max(abs(x2 - x1), abs(y2 - y1), 1)
+        half = width // 2
+        for i in range(steps + 1):
+            x = round(x1 + (x2 - x1) * i / steps)
+            y = round(y1 + (y2 - y1) * i / steps)
+            self.fill(x - half, y - half, x - half + width, y - half + width, color)
+
+    def flush(self):
+        """Draw the queued lines at once: every stamp of every line is one array operation per offset."""
+        # The same centres as line() stamps one at a time, so both paths draw the same pixels
+        if not self.pending:
+            return
+        color = self.pending[0][5]
+        x1, y1, x2, y2, widths = np.array([line[:5] for line in self.pending], dtype=np.int64).T
+        self.pending.clear()
+        steps = np.maximum(np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)), 1)
+        counts = steps + 1
+        owner = np.repeat(np.arange(len(steps)), counts)
+        i = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        x = np.round(x1[owner] + (x2 - x1)[owner] * i / steps[owner]).astype(np.int64)
+        y = np.round(y1[owner] + (y2 - y1)[owner] * i / steps[owner]).astype(np.int64)
+        widths = widths[owner]
+        for width in np.unique(widths).tolist():
+            chosen = widths == width
+            left = x[chosen] - width // 2
+            top = y[chosen] - width // 2
+            for dy in range(width):
+                for dx in range(width):
+                    px = left + dx
+                    py = top + dy
+                    inside = (px >= 0) & (px < self.size) & (py >= 0) & (py < self.size)
+                    self.pixels[py[inside], px[inside]] = color
+
+    def text(self, x, y, digits, scale, color):
+        """Draw a number with the built-in digit font, top-left at (x, y)."""
+        for i, digit in enumerate(digits):
+            for row, bits in enumerate(DIGITS[digit]):
+                for col, bit in enumerate(bits):
+                    if bit == "1":
+                        px = x + (i * 4 + col) * scale
+                        py = y + row * scale
+                        self.fill(px, py, px + scale, py + scale, color)
+
+    def cell_centre(self, cell):
+        """Return the pixel centre of a numbered cell, laid out like the board."""
+        row, col = divmod(cell - 1, self.board_size)
+        return (col * self.cell_size + self.cell_size // 2,
+                (self.board_size - row - 1) * self.cell_size + self.cell_size // 2)
+
+    def ppm(self):
+        """Return the buffer as binary PPM data, which Tk's PhotoImage reads directly."""
+        if np is not None:
+            self.flush()
+            return b"P6 %d %d 255\n" % (self.size, self.size) + self.pixels.tobytes()
+        return b"P6 %d %d 255\n" % (self.size, self.size) + bytes(self.pixels)
+
+def render_board(board_size=10, snakes=None, ladders=None, cell_size=60):
+    """Draw the static board (cells, numbers, snakes and ladders) and return it as PPM data."""
+    snakes = SNAKES if snakes is None else snakes
+    ladders = LADDERS if ladders is None else ladders
+    raster = BoardRaster(board_size, cell_size)
+    scale = max(1, cell_size // 20)
+    for cell in range(1, board_size * board_size + 1):
+        cx, cy = raster.cell_centre(cell)
+        x1 = cx - cell_size // 2
+        y1 = cy - cell_size // 2
+        row, col = divmod(cell - 1, board_size)
+        raster.fill(x1, y1, x1 + cell_size, y1 + cell_size, LIGHT if (row + col) % 2 == 0 else DARK)
+        if cell_size >= 12:
+            raster.text(x1 + 2 * scale, y1 + 2 * scale, str(cell), scale, NUMBER)
+
+    # Grid lines between cells
+    for i in range(board_size + 1):
+        edge = i * cell_size
+        raster.fill(edge - 1, 0, edge + 1, raster.size, GRID)
+        raster.fill(0, edge - 1, raster.size, edge + 1, GRID)
+
+    width = max(2, cell_size // 12)
+    for start, end in ladders.items():
+        # Two rails with rungs between them
+        (x1, y1), (x2, y2) = raster.cell_centre(start), raster.cell_centre(end)
+        length = max(1.0, ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5)
+        ox = round((y2 - y1) / length * cell_size / 6)
+        oy = round((x1 - x2) / length * cell_size / 6)
+        raster.line(x1 + ox, y1 + oy, x2 + ox, y2 + oy, width, LADDER)
+        raster.line(x1 - ox, y1 - oy, x2 - ox, y2 - oy, width, LADDER)
+        rungs = max(1, int(length // (cell_size / 3)))
+        for i in range(1, rungs):
+            rx = round(x1 + (x2 - x1) * i / rungs)
+            ry = round(y1 + (y2 - y1) * i / rungs)
+            raster.line(rx + ox, ry + oy, rx - ox, ry - oy, max(1, width // 2), LADDER)
+    # Thick bodies with a bigger head on each start cell; all in one color, so the
+    # bodies are queued together before the heads
+    for start, end in snakes.items():
+        (x1, y1), (x2, y2) = raster.cell_centre(start), raster.cell_centre(end)
+        raster.line(x1, y1, x2, y2, width + 1, SNAKE)
+    head = max(4, cell_size // 4)
+    for start in snakes:
+        x1, y1 = raster.cell_centre(start)
+        raster.fill(x1 - head // 2, y1 - head // 2, x1 + head - head // 2, y1 + head - head // 2, SNAKE)
+    return raster.ppm()
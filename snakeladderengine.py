@@ -0,0 +1,115 @@
+import json
+import random
+
+# The classic 10x10 layout: start cell -> end cell
+SNAKES = {16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 64: 60, 87: 24, 93: 73, 95: 75, 98: 78}
+LADDERS = {1: 38, 4: 14, 9: 31, 21: 42, 28: 84, 36: 44, 51: 67, 71: 91, 80: 100}
+
+def check_layout(board_size, snakes, ladders):
+    """Raise ValueError unless snakes go down, ladders go up and no cell is used twice."""
+    # Using every cell at most once rules out chains (a jump landing on another jump's
+    # start) and therefore loops
+    cells = board_size * board_size
+    used = set()
+    for kind, jumps, goes_up in (("Snake", snakes, False), ("Ladder", ladders, True)):
+        for start, end in jumps.items():
+            if not (1 <= start < cells and 1 <= end <= cells):
+                raise ValueError(f"{kind} {start}->{end} is off the board")
+            if (end > start) != goes_up:
+                raise ValueError(f"{kind} {start}->{end} goes the wrong way")
+            if start in used or end in used:
+                raise ValueError(f"{kind} {start}->{end} shares a cell with another snake or ladder")
+            used.update((start, end))
+
+def random_layout(board_size, num_snakes, num_ladders, min_length=3, rng=None):
+    """Place snakes and ladders at random with no cell used twice and return (snakes, ladders)."""
+    rng = rng or random.Random()
+    cells = board_size * board_size
+    if 2 * (num_snakes + num_ladders) > cells - 2 or min_length >= cells / 2:
+        raise ValueError("Too many snakes and ladders for the board")
+    used = set()
+    snakes = {}
+    ladders = {}
+    for jumps, goes_up, count in ((snakes, False, num_snakes), (ladders, True, num_ladders)):
+        while len(jumps) < count:
+            if goes_up:
+                start = rng.randint(1, cells - min_length)
+                end = rng.randint(start + min_length, cells)
+            else:
+                start = rng.randint(1 + min_length, cells - 1)
+                end = rng.randint(1, start - min_length)
+            if start in used or end in used:
+                continue
+            used.update((start, end))
+            jumps[start] = end
+    return snakes, ladders
+
+def load_layout(path):
+    """Read a board layout saved by save_layout and return (board_size, snakes, ladders)."""
+    with open(path) as f:
+        data = json.load(f)
+    board_size = int(data["board_size"])
+    snakes = {int(start): int(end) for start, end in data["snakes"].items()}
+    ladders = {int(start): int(end) for start, end in data["ladders"].items()}
+    check_layout(board_size, snakes, ladders)
+    return board_size, snakes, ladders
+
+def save_layout(path, board_size, snakes, ladders, **extra):
+    """Write a board layout as JSON; extra keys such as statistics are stored alongside it."""
+    check_layout(board_size, snakes, ladders)
+    with open(path, "w") as f:
+        json.dump({"board_size": board_size, "snakes": snakes, "ladders": ladders, **extra}, f, indent=2)
+
+class SnakeLadderEngine:
+    def __init__(self, board_size=10, snakes=None, ladders=None, num_players=2, seed=None):
+        """Initialize the Snake and Ladder rules without any widgets."""
+        self.board_size = board_size
+        self.num_cells = board_size * board_size
+        self.snakes = dict(SNAKES if snakes is None else snakes)
+        self.ladders = dict(LADDERS if ladders is None else ladders)
+        self.num_players = num_players
+        self.random = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        """Put every player back at the start."""
+        self.player_positions = [0] * self.num_players
+        self.turn = 0  # Player 1 starts first
+        self.dice_roll = 0  # Current dice roll
+        self.last_event = None  # "snake", "ladder" or None for the last move
+        self.game_over = False
+
+    def roll(self, dice_roll=None):
+        """Roll the dice for the current player and return the player who moved."""
+        if self.game_over:
+            return None
+        player = self.turn
+        self.dice_roll = dice_roll or self.random.randint(1, 6)
+
+        # A roll past the last cell leaves the player where they are
+        new_position = self.player_positions[player] + self.dice_roll
+        if new_position <= self.num_cells:
+            self.player_positions[player] = new_position
+
+        # Check for snakes or ladders
+        position = self.player_positions[player]
+        if position in self.snakes:
+            self.player_positions[player] = self.snakes[position]
+            self.last_event = "snake"
+        elif position in self.ladders:
+            self.player_positions[player] = self.ladders[position]
+            self.last_event = "ladder"
+        else:
+            self.last_event = None
+
+        # Check for winner, otherwise switch turns
+        if self.player_positions[player] == self.num_cells:
+            self.game_over = True
+        else:
+            self.turn = (self.turn + 1) % self.num_players
+        return player
+
+    @property
+    def winner(self):
+        """Return the index of the winning player, or None while the game is on."""
+        return self.turn if self.game_over else None
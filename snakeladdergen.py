@@ -0,0 +1,117 @@
+import argparse
+import math
+import random
+import time
+
+from snakeladderengine import check_layout, random_layout, save_layout
+from snakeladdermarkov import IncrementalEvaluator, analyze
+
+def propose(layout, board_size, min_length, rng):
+    """Return the changes, as (cell, new target or None), that move one end of one snake or ladder."""
+    cells = board_size * board_size
+    used = set(layout) | set(layout.values())
+    start = rng.choice(list(layout))
+    end = layout[start]
+    goes_up = end > start
+    if rng.random() < 0.5:
+        # Move the end, keeping the direction
+        new_end = rng.randint(start + min_length, cells) if goes_up else rng.randint(1, start - min_length)
+        if new_end in used:
+            return None
+        return [(start, new_end)]
+    # Move the start, keeping the end
+    new_start = rng.randint(1, end - min_length) if goes_up else rng.randint(end + min_length, cells - 1)
+    if new_start in used:
+        return None
+    return [(start, None), (new_start, end)]
+
+def length_error(expected, variance, target_turns, target_variance):
+    """Return the squared distance from the targets, in turns squared."""
+    # The variance is compared as a standard deviation so both terms are in turns
+    error = (expected - target_turns) ** 2
+    if target_variance is not None:
+        error += (math.sqrt(max(variance, 0.0)) - math.sqrt(target_variance)) ** 2
+    return error
+
+def generate(board_size=10, num_snakes=10, num_ladders=9, target_turns=40.0, iterations=20000,
+             min_length=3, tolerance=0.01, temperature=4.0, seed=None, target_variance=None):
+    """Search for a layout whose exact expected game length (and variance) is close to the targets."""
+    # Simulated annealing on the squared error of the expected turns, plus that of the standard
+    # deviation with target_variance. Every candidate is scored exactly by IncrementalEvaluator
+    # without rebuilding the chain.
+    rng = random.Random(seed)
+    snakes, ladders = random_layout(board_size, num_snakes, num_ladders, min_length, rng)
+    layout = {**snakes, **ladders}
+    evaluator = IncrementalEvaluator(board_size, {}, layout)
+    with_variance = target_variance is not None
+    error = length_error(evaluator.expected[0], evaluator.variance(), target_turns, target_variance)
+    best_layout, best_error = dict(layout), error
+    candidates = 0
+    accepted = 0
+    start_time = time.perf_counter()
+
+    for step in range(iterations):
+        if best_error <= tolerance ** 2:
+            break
+        changes = propose(layout, board_size, min_length, rng)
+        if changes is None:
+            continue
+        candidates += 1
+        if with_variance:
+            new_error = length_error(*evaluator.score(changes, variance=True), target_turns, target_variance)
+        else:
+            new_error = (evaluator.score(changes) - target_turns) ** 2
+        # Geometric cooling from temperature down to a thousandth of it
+        heat = temperature * 0.001 ** (step / iterations)
+        if new_error <= error or rng.random() < math.exp((error - new_error) / heat):
+            evaluator.apply(changes)
+            for cell, target in changes:
+                if target is None:
+                    del layout[cell]
+                else:
+                    layout[cell] = target
+            error = new_error
+            if error < best_error:
+                best_layout, best_error = dict(layout), error
+            accepted += 1
+            if accepted % 500 == 0:
+                evaluator.refresh()
+    elapsed = time.perf_counter() - start_time
+
+    snakes = {start: end for start, end in best_layout.items() if end < start}
+    ladders = {start: end for start, end in best_layout.items() if end > start}
+    check_layout(board_size, snakes, ladders)
+    stats = analyze(board_size, snakes, ladders)
+    return {
+        "board_size": board_size,
+        "snakes": snakes,
+        "ladders": ladders,
+        "expected_turns": stats["expected_turns"],
+        "variance_turns": stats["variance_turns"],
+        "candidates": candidates,
+        "candidates_per_second": candidates / elapsed if elapsed else 0.0,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate Snake and Ladder boards with a target game length")
+    parser.add_argument("--board-size", type=int, default=10)
+    parser.add_argument("--snakes", type=int, default=10)
+    parser.add_argument("--ladders", type=int, default=9)
+    parser.add_argument("--target", type=float, default=40.0, help="expected turns for one player to finish")
+    parser.add_argument("--variance", type=float, default=None, help="variance of the game length to aim for")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--min-length", type=int, default=3, help="shortest snake or ladder in cells")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", help="save the board as JSON for snakeandladder.py --layout")
+    args = parser.parse_args()
+
+    board = generate(args.board_size, args.snakes, args.ladders, args.target, args.iterations,
+                     args.min_length, seed=args.seed, target_variance=args.variance)
+    print(f"Snakes: {board['snakes']}")
+    print(f"Ladders: {board['ladders']}")
+    print(f"Expected turns: {board['expected_turns']:.3f} (target {args.target})")
+    print(f"Variance: {board['variance_turns']:.1f}" + (f" (target {args.variance})" if args.variance is not None else ""))
+    print(f"{board['candidates']} candidates at {board['candidates_per_second']:,.0f}/sec")
+    if args.out:
+        save_layout(args.out, board["board_size"], board["snakes"], board["ladders"],
+                    expected_turns=board["expected_turns"], variance_turns=board["variance_turns"])
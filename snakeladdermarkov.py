@@ -0,0 +1,189 @@
+import argparse
+import functools
+
+import numpy as np
+
+from snakeladderengine import LADDERS, SNAKES
+
+def layout_key(board_size=10, snakes=None, ladders=None):
+    """Return a hashable key for a board layout."""
+    snakes = SNAKES if snakes is None else snakes
+    ladders = LADDERS if ladders is None else ladders
+    return board_size, tuple(sorted(snakes.items())), tuple(sorted(ladders.items()))
+
+def transition_matrix(board_size=10, snakes=None, ladders=None, sides=6):
+    """Return the (cells + 1) x (cells + 1) matrix of one player's move probabilities."""
+    # State 0 is off the board before the first roll and the last cell is absorbing.
+    # The rules follow SnakeLadderEngine: a roll past the last cell leaves the player
+    # where they are, and a snake or ladder is taken where the player lands.
+    _, snakes, ladders = layout_key(board_size, snakes, ladders)
+    jumps = dict(snakes)
+    jumps.update(ladders)
+    cells = board_size * board_size
+    matrix = np.zeros((cells + 1, cells + 1))
+    for position in range(cells):
+        for roll in range(1, sides + 1):
+            target = position + roll if position + roll <= cells else position
+            matrix[position, jumps.get(target, target)] += 1 / sides
+    matrix[cells, cells] = 1.0
+    return matrix
+
+def length_distribution(matrix, start=0, max_turns=10000, tolerance=1e-12):
+    """Return P(game ends on turn t) for t = 0, 1, ... until almost no probability is left."""
+    cells = len(matrix) - 1
+    state = np.zeros(len(matrix))
+    state[start] = 1.0
+    finished = [state[cells]]
+    while 1.0 - state[cells] > tolerance and len(finished) <= max_turns:
+        state = state @ matrix
+        finished.append(state[cells])
+    return np.diff(finished, prepend=0.0)
+
+@functools.lru_cache(maxsize=32)
+def _analyze(key, sides):
+    board_size, snakes, ladders = key
+    matrix = transition_matrix(board_size, dict(snakes), dict(ladders), sides)
+    cells = board_size * board_size
+
+    # Fundamental matrix of the absorbing chain: fundamental[i, j] is the expected
+    # number of turns spent in transient state j when starting from i
+    transient = matrix[:cells, :cells]
+    fundamental = np.linalg.inv(np.eye(cells) - transient)
+    expected_turns = fundamental.sum(axis=1)
+    # Var = (2N - I)t - t^2, with t the expected turns
+    variance = 2 * fundamental @ expected_turns - expected_turns - expected_turns ** 2
+
+    # Visiting j at least once from the start: N[0, j] / N[j, j]
+    visits = fundamental[0]
+    visit_probability = visits / np.diag(fundamental)
+
+    lengths = length_distribution(matrix)
+    cumulative = np.cumsum(lengths)
+    return {
+        "matrix": matrix,
+        "expected_turns": float(expected_turns[0]),
+        "expected_turns_from": np.append(expected_turns, 0.0),  # Per position, 0 once finished
+        "variance_turns": float(variance[0]),
+        "length_distribution": lengths,
+        "median_turns": int(np.searchsorted(cumulative, 0.5)),
+        "p90_turns": int(np.searchsorted(cumulative, 0.9)),
+        "expected_visits": np.append(visits, 1.0),
+        "visit_probability": np.append(visit_probability, 1.0),
+    }
+
+def analyze(board_size=10, snakes=None, ladders=None, sides=6):
+    """Return exact single-player statistics for a layout, cached per layout."""
+    # The arrays are shared between callers with the same layout, so treat them as read-only
+    return _analyze(layout_key(board_size, snakes, ladders), sides)
+
+class IncrementalEvaluator:
+    def __init__(self, board_size=10, snakes=None, ladders=None, sides=6):
+        """Keep the fundamental matrix of a layout and update it as snakes and ladders move."""
+        # Pointing the cell `start` at a new target moves the probability of landing on it
+        # from one column of Q to another, a rank-1 change. A move of k such changes is
+        # scored with the Woodbury identity in O(k * cells) and applied in O(k * cells^2).
+        # N^2 is kept alongside N for the second moment of the game length.
+        _, snakes, ladders = layout_key(board_size, snakes, ladders)
+        self.board_size = board_size
+        self.cells = board_size * board_size
+        self.sides = sides
+        self.landing = transition_matrix(board_size, {}, {}, sides)[:self.cells]
+        self.targets = dict(snakes)
+        self.targets.update(ladders)
+        self.refresh()
+
+    def refresh(self):
+        """Rebuild the fundamental matrix from scratch, dropping accumulated rounding error."""
+        snakes = {start: end for start, end in self.targets.items() if end < start}
+        ladders = {start: end for start, end in self.targets.items() if end > start}
+        matrix = transition_matrix(self.board_size, snakes, ladders, self.sides)
+        self.fundamental = np.linalg.inv(np.eye(self.cells) - matrix[:self.cells, :self.cells])
+        self.square = self.fundamental @ self.fundamental
+        self.expected = self.fundamental.sum(axis=1)
+        self.second = self.square.sum(axis=1)  # N t
+
+    def variance(self, start=0):
+        """Return the variance of the game length from start: ((2N - I)t - t^2)[start]."""
+        return float(2 * self.second[start] - self.expected[start] - self.expected[start] ** 2)
+
+    def low_rank(self, changes):
+        """Return U and the sparse rows of V for changes of (cell, new target or None)."""
+        # Q' = Q + U V^T, where column k of U is the chance of landing on changes[k]'s cell and
+        # row k of V is +1 at the new target and -1 at the old one (absorbing targets drop out)
+        columns = []
+        rows = []
+        for cell, target in changes:
+            old = self.targets.get(cell, cell)
+            new = cell if target is None else target
+            columns.append(self.landing[:, cell])
+            rows.append([(index, sign) for index, sign in ((new, 1.0), (old, -1.0)) if index < self.cells])
+        return np.array(columns).T, rows
+
+    def score(self, changes, start=0, variance=False):
+        """Return the expected turns from start if the changes were made, without making them.
+
+        With variance=True return (expected turns, variance of the game length) instead.
+        """
+        columns, rows = self.low_rank(changes)
+        # (I - Q')^-1 = N + N U (I - V^T N U)^-1 V^T N, so t' = t + N U (I - V^T N U)^-1 V^T t
+        k = len(changes)
+        inner = np.eye(k)
+        vt_t = np.zeros(k)
+        for i, row in enumerate(rows):
+            for index, sign in row:
+                inner[i] -= sign * (self.fundamental[index] @ columns)
+                vt_t[i] += sign * self.expected[index]
+        weights = np.linalg.solve(inner, vt_t)
+        start_columns = self.fundamental[start] @ columns
+        expected = float(self.expected[start] + start_columns @ weights)
+        if not variance:
+            return expected
+        # N' t' = N t' + N U (I - V^T N U)^-1 V^T N t', where N t' = N t + N^2 U weights
+        # is only needed at start and at the rows of V
+        def n_t(index):
+            return self.second[index] + (self.square[index] @ columns) @ weights
+        vt_n_t = np.zeros(k)
+        for i, row in enumerate(rows):
+            for index, sign in row:
+                vt_n_t[i] += sign * n_t(index)
+        second = n_t(start) + start_columns @ np.linalg.solve(inner, vt_n_t)
+        return expected, float(2 * second - expected - expected ** 2)
+
+    def apply(self, changes):
+        """Make the changes and update the fundamental matrix to match."""
+        columns, rows = self.low_rank(changes)
+        k = len(changes)
+        n_u = self.fundamental @ columns
+        vt_n = np.zeros((k, self.cells))
+        for i, row in enumerate(rows):
+            for index, sign in row:
+                vt_n[i] += sign * self.fundamental[index]
+        inner = np.eye(k) - vt_n @ columns
+        update = np.linalg.solve(inner, vt_n)
+        # (N + A B)^2 = N^2 + N A B + A B N + A (B A) B with A = N U, B = the update rows
+        self.square += (self.fundamental @ n_u) @ update + n_u @ (update @ self.fundamental) \
+            + n_u @ ((update @ n_u) @ update)
+        self.fundamental += n_u @ update
+        self.expected = self.fundamental.sum(axis=1)
+        self.second = self.square.sum(axis=1)
+        for cell, target in changes:
+            if target is None:
+                del self.targets[cell]
+            else:
+                self.targets[cell] = target
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exact Snake and Ladder statistics from a Markov chain")
+    parser.add_argument("--top", type=int, default=10, help="most visited cells to list")
+    args = parser.parse_args()
+
+    stats = analyze()
+    lengths = stats["length_distribution"]
+    print(f"Expected turns to finish: {stats['expected_turns']:.3f}  "
+          f"Standard deviation: {stats['variance_turns'] ** 0.5:.3f}")
+    print(f"Shortest game: {int(np.argmax(lengths > 0))} turns  Median: {stats['median_turns']}  "
+          f"90%: {stats['p90_turns']}  Most likely: {int(np.argmax(lengths))}")
+    print("Most visited cells:")
+    probabilities = stats["visit_probability"][1:-1]
+    for index in np.argsort(probabilities)[::-1][:args.top]:
+        print(f"  {index + 1:3d}: {probabilities[index]:.2%}")
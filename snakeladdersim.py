@@ -0,0 +1,120 @@
+import argparse
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from snakeladderengine import LADDERS, SNAKES
+
+def jump_table(board_size=10, snakes=None, ladders=None, sides=6):
+    """Return table[position, roll - 1] = where a player on position ends up after that roll."""
+    # Same rules as SnakeLadderEngine: a roll past the last cell stays put, then any
+    # snake or ladder on the landing cell is taken. The last cell maps to itself.
+    snakes = SNAKES if snakes is None else snakes
+    ladders = LADDERS if ladders is None else ladders
+    cells = board_size * board_size
+    landing = np.arange(cells + 1)
+    for start, end in list(snakes.items()) + list(ladders.items()):
+        landing[start] = end
+    targets = np.arange(cells + 1)[:, None] + np.arange(1, sides + 1)[None, :]
+    targets = np.where(targets <= cells, targets, np.arange(cells + 1)[:, None])
+    # int16 halves the memory traffic of the gathers; boards past 181x181 need int32
+    dtype = np.int16 if cells <= np.iinfo(np.int16).max else np.int32
+    return landing[targets].astype(dtype)
+
+def play_batch(table, games, num_players, rng, max_rounds=100000):
+    """Play games at once and return (winning player, rounds played) arrays."""
+    # Players never interact, so a whole round is one gather for every player in every game.
+    # The first player in turn order to reach the last cell wins.
+    cells = len(table) - 1
+    sides = table.shape[1]
+    positions = np.zeros((games, num_players), dtype=table.dtype)
+    active = np.arange(games)
+    winners = np.empty(games, dtype=np.int8)
+    lengths = np.empty(games, dtype=np.int32)
+    for rounds in range(1, max_rounds + 1):
+        rolls = rng.integers(0, sides, size=positions.shape, dtype=np.int8)
+        positions = table[positions, rolls]
+        finished = positions == cells
+        done = finished.any(axis=1)
+        if done.any():
+            winners[active[done]] = finished[done].argmax(axis=1)
+            lengths[active[done]] = rounds
+            # Drop finished games so later rounds only touch the ones still going
+            active = active[~done]
+            positions = positions[~done]
+            if not len(active):
+                return winners, lengths
+    raise RuntimeError(f"{len(active)} games did not finish within {max_rounds} rounds")
+
+def play_shard(job):
+    """Play one process's share of the games and return win counts and a length histogram."""
+    board_size, snakes, ladders, games, num_players, seed, batch_size = job
+    table = jump_table(board_size, snakes, ladders)
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(num_players, dtype=np.int64)
+    length_counts = np.zeros(1, dtype=np.int64)
+    for start in range(0, games, batch_size):
+        winners, lengths = play_batch(table, min(batch_size, games - start), num_players, rng)
+        wins += np.bincount(winners, minlength=num_players)
+        counts = np.bincount(lengths)
+        if len(counts) > len(length_counts):
+            length_counts = np.pad(length_counts, (0, len(counts) - len(length_counts)))
+        length_counts[:len(counts)] += counts
+    return wins, length_counts
+
+def percentile_from_counts(counts, p):
+    """Return the smallest value with at least p percent of the samples at or below it."""
+    cumulative = np.cumsum(counts)
+    return int(np.searchsorted(cumulative, cumulative[-1] * p / 100))
+
+def simulate(games, num_players=2, board_size=10, snakes=None, ladders=None,
+             workers=1, seed=None, batch_size=1000000):
+    """Play games in vectorized batches, optionally sharded over processes, and return the statistics."""
+    workers = max(1, min(workers or os.cpu_count() or 1, games))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    jobs = []
+    for i in range(workers):
+        shard_games = games // workers + (1 if i < games % workers else 0)
+        jobs.append((board_size, snakes, ladders, shard_games, num_players, seeds[i], batch_size))
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = list(map(play_shard, jobs))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(play_shard, jobs, chunksize=1)
+    elapsed = time.perf_counter() - start
+
+    wins = sum(shard_wins for shard_wins, _ in results)
+    longest = max(len(counts) for _, counts in results)
+    length_counts = sum(np.pad(counts, (0, longest - len(counts))) for _, counts in results)
+    return {
+        "games": games,
+        "win_rates": (wins / games).tolist(),  # By turn order
+        "mean_rounds": float(np.arange(longest) @ length_counts / games),
+        "percentiles": {p: percentile_from_counts(length_counts, p) for p in (5, 25, 50, 75, 95, 99)},
+        "longest": longest - 1,
+        "length_counts": length_counts,
+        "games_per_second": games / elapsed,
+        "seconds": elapsed,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vectorized Snake and Ladder Monte Carlo simulator")
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=1, help="processes to shard over (0: all cores)")
+    parser.add_argument("--batch-size", type=int, default=1000000, help="games played at once per process")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    stats = simulate(args.games, args.players, workers=args.workers, seed=args.seed,
+                     batch_size=args.batch_size)
+    print(f"{stats['games']:,} games with {args.players} players")
+    print("Win rate by turn order: " + "  ".join(f"P{i + 1}: {rate:.2%}"
+                                                 for i, rate in enumerate(stats["win_rates"])))
+    print(f"Rounds: mean {stats['mean_rounds']:.2f}, longest {stats['longest']}, " +
+          ", ".join(f"p{p} {value}" for p, value in stats["percentiles"].items()))
+    print(f"Throughput: {stats['games_per_second']:,.0f} games/sec in {stats['seconds']:.2f}s")
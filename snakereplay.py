@@ -0,0 +1,107 @@
+import argparse
+import time
+
+from snakeengine import SnakeEngine
+
+# File layout: MAGIC, then varints for board size, seed, final tick, final score and the
+# number of turns, then one varint per turn holding (ticks since the last turn << 2 | direction)
+MAGIC = b"SNK1"
+DIRECTION_CODES = {"Left": 0, "Right": 1, "Up": 2, "Down": 3}
+CODE_DIRECTIONS = ["Left", "Right", "Up", "Down"]
+
+def write_varint(out, value):
+    """Append an unsigned integer as a little-endian base-128 varint."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(data, pos):
+    """Read a varint at pos and return (value, position after it)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def encode(engine):
+    """Return the replay log of an engine's game so far."""
+    out = bytearray(MAGIC)
+    for value in (engine.board_size, engine.seed, engine.ticks, engine.score, len(engine.turns)):
+        write_varint(out, value)
+    last_tick = 0
+    for tick, direction in engine.turns:
+        write_varint(out, (tick - last_tick) << 2 | DIRECTION_CODES[direction])
+        last_tick = tick
+    return bytes(out)
+
+def decode(data):
+    """Parse a replay log into its header fields and a list of (tick, direction) turns."""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a Snake replay")
+    pos = len(MAGIC)
+    header = []
+    for _ in range(5):
+        value, pos = read_varint(data, pos)
+        header.append(value)
+    board_size, seed, ticks, score, count = header
+    turns = []
+    tick = 0
+    for _ in range(count):
+        value, pos = read_varint(data, pos)
+        tick += value >> 2
+        turns.append((tick, CODE_DIRECTIONS[value & 3]))
+    return {"board_size": board_size, "seed": seed, "ticks": ticks, "score": score, "turns": turns}
+
+def save(engine, path):
+    """Write an engine's replay log to a file."""
+    with open(path, "wb") as f:
+        f.write(encode(engine))
+
+def load(path):
+    """Read and parse a replay file."""
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+class ReplayCursor:
+    def __init__(self, turns):
+        """Feed recorded turns back into an engine at the ticks they were made."""
+        self.turns = turns
+        self.index = 0
+
+    def apply(self, engine):
+        """Make every turn that was recorded before the engine's next step."""
+        while self.index < len(self.turns) and self.turns[self.index][0] <= engine.ticks:
+            engine.change_direction(self.turns[self.index][1])
+            self.index += 1
+
+def replay(log):
+    """Re-simulate a decoded replay headless and return the finished engine."""
+    engine = SnakeEngine(log["board_size"], log["seed"])
+    cursor = ReplayCursor(log["turns"])
+    while engine.ticks < log["ticks"] and not engine.game_over:
+        cursor.apply(engine)
+        engine.step()
+    return engine
+
+def verify(log):
+    """Return True if re-simulating the replay reaches the recorded score and tick."""
+    engine = replay(log)
+    return engine.score == log["score"] and engine.ticks == log["ticks"]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify Snake replays by re-simulating them")
+    parser.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    for path in args.files:
+        log = load(path)
+        start = time.perf_counter()
+        ok = verify(log)
+        elapsed = time.perf_counter() - start
+        print(f"{path}: score {log['score']} in {log['ticks']} ticks, {len(log['turns'])} turns "
+              f"- {'OK' if ok else 'MISMATCH'} ({elapsed * 1000:.1f} ms)")
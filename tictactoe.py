@@ -1,21 +1,131 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
+import threading
+
+from tictactoeai import TicTacToeAI
+from tictactoeengine import TicTacToeEngine
+
+# Menu metadata, read by the game registry without importing this module
+GAME_INFO = {"title": "Tic Tac Toe", "class": "TicTacToe"}
+
+# Boards at least this big are drawn on one Canvas instead of a grid of Buttons
+CANVAS_BOARD_SIZE = 6
+
+class ButtonBoard:
+    def __init__(self, master, size, on_click):
+        """Create one Button per cell, for small boards."""
+        self.frame = tk.Frame(master)
+        self.frame.pack()
+        self.touched = set()  # Cells whose button differs from a blank one
+
+        self.buttons = [[None for _ in range(size)] for _ in range(size)]
+        for row in range(size):
+            for col in range(size):
+                btn = tk.Button(
+                    self.frame,
+                    text="",
+                    font=("Arial", 24),
+                    width=5,
+                    height=2,
+                    command=lambda r=row, c=col: on_click(r, c),
+                    bg="white"
+                )
+                btn.grid(row=row, column=col)
+                self.buttons[row][col] = btn
+
+    def set_mark(self, row, col, player, color):
+        """Show a player's mark in a cell."""
+        self.buttons[row][col].config(text=player, fg=color)
+        self.touched.add((row, col))
+
+    def highlight(self, cells, color):
+        """Change the background of some cells."""
+        for row, col in cells:
+            self.buttons[row][col].config(bg=color)
+            self.touched.add((row, col))
+
+    def fill(self, color):
+        """Change the background of every cell."""
+        for row, buttons in enumerate(self.buttons):
+            for col, button in enumerate(buttons):
+                button.config(bg=color)
+                self.touched.add((row, col))
+
+    def clear(self):
+        """Blank the cells that were changed since the last clear."""
+        for row, col in self.touched:
+            self.buttons[row][col].config(text="", bg="white")
+        self.touched.clear()
+
+class CanvasBoard:
+    def __init__(self, master, size, on_click, max_pixels=640):
+        """Draw the board on a single Canvas, for large boards."""
+        self.size = size
+        self.on_click = on_click
+        self.cell_size = max(12, min(80, max_pixels // size))
+        pixels = self.cell_size * size
+        self.canvas = tk.Canvas(master, width=pixels, height=pixels, bg="white",
+                                highlightthickness=0)
+        self.canvas.pack()
+
+        # The grid is drawn once; only marks and highlights change during play
+        for i in range(1, size):
+            offset = i * self.cell_size
+            self.canvas.create_line(offset, 0, offset, pixels, fill="black", tags="grid")
+            self.canvas.create_line(0, offset, pixels, offset, fill="black", tags="grid")
+        self.font = ("Arial", max(8, int(self.cell_size * 0.5)))
+        self.canvas.bind("<Button-1>", self.click)
+
+    def click(self, event):
+        """Turn a click position into a cell."""
+        row = event.y // self.cell_size
+        col = event.x // self.cell_size
+        if 0 <= row < self.size and 0 <= col < self.size:
+            self.on_click(row, col)
+
+    def set_mark(self, row, col, player, color):
+        """Draw a player's mark in a cell."""
+        self.canvas.create_text((col + 0.5) * self.cell_size, (row + 0.5) * self.cell_size,
+                                text=player, fill=color, font=self.font, tags="mark")
+
+    def highlight(self, cells, color):
+        """Shade some cells underneath the grid and the marks."""
+        for row, col in cells:
+            self.canvas.create_rectangle(col * self.cell_size, row * self.cell_size,
+                                         (col + 1) * self.cell_size, (row + 1) * self.cell_size,
+                                         fill=color, outline="", tags="highlight")
+        self.canvas.tag_lower("highlight")
+
+    def fill(self, color):
+        """Change the background of the whole board."""
+        self.canvas.config(bg=color)
+
+    def clear(self):
+        """Remove every mark and highlight in one go."""
+        self.canvas.delete("mark", "highlight")
+        self.canvas.config(bg="white")
 
 class TicTacToe:
-    def __init__(self, root):
-        """Initialize the Tic Tac Toe game."""
+    def __init__(self, root, size=3, k=None, computer=False, time_limit=1.0):
+        """Initialize the Tic Tac Toe game on a size x size board with k in a row to win."""
         self.root = root
         self.root.title("Tic Tac Toe")
         
-        self.current_player = "X"
-        self.board = [["" for _ in range(3)] for _ in range(3)]
+        self.engine = TicTacToeEngine(size, k)
+        self.size = self.engine.size
         self.scores = {"X": 0,
         "O": 0,
         "Ties": 0}
         self.colors = {"X": "blue", 
         "O": "green", 
         "Ties": "gray"}
+
+        # Single-player mode: the computer plays O
+        self.computer_player = "O"
+        self.vs_computer = tk.BooleanVar(value=computer)
+        self.ai = TicTacToeAI(self.size, self.engine.k, time_limit)
+        self.thinking = False
+        self.game_id = 0  # Changes on every reset so a stale computer move is dropped
         
         self.create_widgets()
         self.create_board()
@@ -34,7 +144,7 @@ class TicTacToe:
 
         # Turn display
         self.turn_label = tk.Label(self.info_frame,
-         text=f"Player {self.current_player}'s turn", font=("Arial", 14))
+         text=f"Player {self.engine.current_player}'s turn", font=("Arial", 14))
         self.turn_label.pack(side=tk.RIGHT, padx=20)
 
         # Reset and Exit buttons
@@ -45,99 +155,109 @@ class TicTacToe:
          text="Reset Scores", command=self.reset_scores, font=("Arial", 12))
         self.reset_button.pack(side=tk.LEFT, padx=10)
 
+        self.computer_check = tk.Checkbutton(self.control_frame,
+         text="Play vs Computer", variable=self.vs_computer,
+         command=self.check_computer_turn, font=("Arial", 12))
+        self.computer_check.pack(side=tk.LEFT, padx=10)
+
         self.exit_button = tk.Button(self.control_frame,
         text="Exit Game", command=self.exit_game, font=("Arial", 12))
         self.exit_button.pack(side=tk.RIGHT, padx=10)
 
     def create_board(self):
-        """Create the 3x3 game board."""
-        self.board_frame = tk.Frame(self.root)
-        self.board_frame.pack()
-
-        self.buttons = [[None for _ in range(3)] for _ in range(3)]
-        for row in range(3):
-            for col in range(3):
-                btn = tk.Button(
-                    self.board_frame,
-                    text="",
-                    font=("Arial", 24),
-                    width=5,
-                    height=2,
-                    command=lambda r=row, c=col: self.make_move(r, c),
-                    bg="white"
-                )
-                btn.grid(row=row, column=col)
-                self.buttons[row][col] = btn
+        """Create the game board."""
+        board_class = CanvasBoard if self.size >= CANVAS_BOARD_SIZE else ButtonBoard
+        self.board_view = board_class(self.root, self.size, self.make_move)
 
     def make_move(self, row, col):
         """Handle a player's move."""
-        if self.board[row][col] == "":
-            self.board[row][col] = self.current_player
-            self.buttons[row][col].config(text=self.current_player, 
-            fg=self.colors[self.current_player])
-            
-            if self.check_winner(row, col):
-                self.highlight_winner(row, col)
-                messagebox.showinfo("Game Over", f"Player {self.current_player} wins!")
-                self.scores[self.current_player] += 1
-                self.reset_board()
-            elif self.is_tie():
-                self.highlight_tie()
-                messagebox.showinfo("Game Over", "It's a tie!")
-                self.scores["Ties"] += 1
-                self.reset_board()
-            else:
-                self.switch_player()
+        if self.thinking:
+            return
+        if self.engine.is_free(row, col):
+            self.play_move(row, col)
         else:
             messagebox.showwarning("Invalid Move", "That spot is already taken!")
 
-    def check_winner(self, row, col):
-        """Check if the current player has won."""
-        # Check row
-        if all(self.board[row][c] == self.current_player for c in range(3)):
-            self.winning_combo = [(row, c) for c in range(3)]
-            return True
-        # Check column
-        if all(self.board[r][col] == self.current_player for r in range(3)):
-            self.winning_combo = [(r, col) for r in range(3)]
-            return True
-        # Check diagonals
-        if row == col and all(self.board[i][i] == self.current_player for i in range(3)):
-            self.winning_combo = [(i, i) for i in range(3)]
-            return True
-        if row + col == 2 and all(self.board[i][2 - i] == self.current_player for i in range(3)):
-            self.winning_combo = [(i, 2 - i) for i in range(3)]
-            return True
-        return False
-
-    def highlight_winner(self, row, col):
-        """Highlight the winning combination."""
-        for r, c in self.winning_combo:
-            self.buttons[r][c].config(bg="lightgreen")
+    def play_move(self, row, col):
+        """Play a move for whoever's turn it is and update the board."""
+        player = self.engine.current_player
+        result = self.engine.make_move(row, col)
+        self.board_view.set_mark(row, col, player, self.colors[player])
+
+        if result == "win":
+            self.highlight_winner()
+            messagebox.showinfo("Game Over", f"Player {player} wins!")
+            self.scores[player] += 1
+            self.reset_board()
+        elif result == "tie":
+            self.highlight_tie()
+            messagebox.showinfo("Game Over", "It's a tie!")
+            self.scores["Ties"] += 1
+            self.reset_board()
+        else:
+            self.update_turn_label()
+            self.check_computer_turn()
 
-    def is_tie(self):
-        """Check if the game is a tie."""
-        return all(self.board[row][col] != "" for row in range(3) for col in range(3))
+    def check_computer_turn(self):
+        """Start the computer's move if it is the computer's turn."""
+        if self.vs_computer.get() and not self.thinking \
+                and self.engine.current_player == self.computer_player:
+            self.thinking = True
+            self.turn_label.config(text="Computer is thinking...")
+            self.reset_button.config(state=tk.DISABLED)
+            # Search on a copy in a thread so the event loop keeps running; the fork gives
+            # the thread its own search state in case a stale search is still finishing
+            engine = self.engine.copy()
+            ai = self.ai.fork()
+            result = []
+            threading.Thread(target=self.search_move, args=(ai, engine, result), daemon=True).start()
+            self.root.after(20, self.finish_computer_move, result, self.game_id)
+
+    def search_move(self, ai, engine, result):
+        """Run in the search thread: store the move, or the error that stopped the search."""
+        try:
+            result.append((ai.choose_move(engine), None))
+        except Exception as e:
+            result.append((None, e))
+
+    def finish_computer_move(self, result, game_id):
+        """Play the computer's move once the search has finished."""
+        if not self.root.winfo_exists():
+            return  # The window was closed while the computer was thinking
+        if not result:
+            self.root.after(20, self.finish_computer_move, result, game_id)
+            return
+        if game_id != self.game_id:
+            return  # The board was reset; a newer search may be running
+        self.thinking = False
+        self.reset_button.config(state=tk.NORMAL)
+        move, error = result[0]
+        if error is not None:
+            self.update_turn_label()
+            messagebox.showerror("Computer Error", f"The computer could not choose a move: {error}")
+            return
+        self.play_move(*move)
+
+    def highlight_winner(self):
+        """Highlight the winning combination."""
+        self.board_view.highlight(self.engine.winning_combo, "lightgreen")
 
     def highlight_tie(self):
         """Highlight the board in case of a tie."""
-        for row in range(3):
-            for col in range(3):
-                self.buttons[row][col].config(bg="lightgray")
+        self.board_view.fill("lightgray")
 
-    def switch_player(self):
-        """Switch the current player."""
-        self.current_player = "O" if self.current_player == "X" else "X"
-        self.turn_label.config(text=f"Player {self.current_player}'s turn")
+    def update_turn_label(self):
+        """Show whose turn it is."""
+        self.turn_label.config(text=f"Player {self.engine.current_player}'s turn")
 
     def reset_board(self):
         """Reset the board for a new game."""
-        self.board = [["" for _ in range(3)] for _ in range(3)]
-        for row in range(3):
-            for col in range(3):
-                self.buttons[row][col].config(text="", bg="white")
-        self.current_player = "X"
-        self.turn_label.config(text=f"Player {self.current_player}'s turn")
+        self.engine.reset()
+        self.game_id += 1
+        self.thinking = False
+        self.reset_button.config(state=tk.NORMAL)
+        self.board_view.clear()
+        self.update_turn_label()
         self.update_score_label()
 
     def reset_scores(self):
@@ -157,9 +277,16 @@ class TicTacToe:
 
     def exit_game(self):
         """Exit the game."""
-        self.root.quit()
+        self.root.destroy()
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Tic Tac Toe")
+    parser.add_argument("--size", type=int, default=3, help="board width and height")
+    parser.add_argument("--k", type=int, default=None, help="marks in a row needed to win")
+    parser.add_argument("--computer", action="store_true", help="play against the computer")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    game = TicTacToe(root)
+    game = TicTacToe(root, size=args.size, k=args.k, computer=args.computer)
     root.mainloop()
@@ -0,0 +1,333 @@
+import copy
+import hashlib
+import json
+import os
+import random
+import time
+
+from tictactoeengine import TicTacToeEngine
+
+# Solved 3x3 tables are cached here, one file per k
+SOLVED_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tictactoe_solved_{k}.json")
+# Bump when the solver or the table format changes so cached tables are rebuilt
+SOLVED_TABLE_VERSION = 2
+
+# Score of a won position; faster wins score higher
+WIN_SCORE = 1_000_000
+
+# Transposition table bound flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time limit for a move runs out."""
+
+def symmetries(size):
+    """Return the 8 cell permutations of the square board's rotations and reflections."""
+    n = size - 1
+    transforms = [
+        lambda r, c: (r, c), lambda r, c: (c, n - r), lambda r, c: (n - r, n - c), lambda r, c: (n - c, r),
+        lambda r, c: (r, n - c), lambda r, c: (n - r, c), lambda r, c: (c, r), lambda r, c: (n - c, n - r),
+    ]
+    perms = []
+    for transform in transforms:
+        perm = []
+        for cell in range(size * size):
+            row, col = transform(*divmod(cell, size))
+            perm.append(row * size + col)
+        perms.append(perm)
+    return perms
+
+class ZobristHasher:
+    def __init__(self, size, seed=0x7A3):
+        """Create fixed Zobrist keys so hashes are stable across runs and on disk."""
+        rng = random.Random(seed * 1000 + size)
+        cells = size * size
+        keys = {player: [rng.getrandbits(64) for _ in range(cells)] for player in "XO"}
+        # keys[player][perm[cell]] for every symmetry, so a move is one XOR per symmetry
+        self.symmetry_keys = {player: [[keys[player][perm[cell]] for cell in range(cells)]
+                                       for perm in symmetries(size)]
+                              for player in "XO"}
+        self.hashes = [0] * 8
+
+    def load(self, engine):
+        """Recompute the hashes from a board."""
+        self.hashes = [0] * 8
+        for player in "XO":
+            bits = engine.bits[player]
+            cell = 0
+            while bits:
+                if bits & 1:
+                    self.toggle(player, cell)
+                bits >>= 1
+                cell += 1
+
+    def toggle(self, player, cell):
+        """Add or remove a mark in every symmetric hash."""
+        hashes = self.hashes
+        keys = self.symmetry_keys[player]
+        for s in range(8):
+            hashes[s] ^= keys[s][cell]
+
+    def fingerprint(self):
+        """Return a short hash of the keys, which tables keyed by this hasher depend on."""
+        return hashlib.sha1(repr(self.symmetry_keys).encode()).hexdigest()[:16]
+
+    def key(self):
+        """Return the same key for a board and all of its rotations and reflections."""
+        return min(self.hashes)
+
+def solve(size=3, k=3):
+    """Return the exact negamax value of every reachable position, keyed by canonical hash."""
+    engine = TicTacToeEngine(size, k)
+    hasher = ZobristHasher(size)
+    table = {}
+
+    def negamax(result):
+        key = hasher.key()
+        if key in table:
+            return table[key]
+        if result == "win":
+            # The player to move has just lost; losing later is better
+            value = -(size * size - engine.moves + 1)
+        elif result == "tie":
+            value = 0
+        else:
+            value = -WIN_SCORE
+            for cell in engine.free_cells():
+                player = engine.current_player
+                child_result = engine.play(cell)
+                hasher.toggle(player, cell)
+                value = max(value, -negamax(child_result))
+                hasher.toggle(player, cell)
+                engine.undo(cell)
+        table[key] = value
+        return value
+
+    negamax(None)
+    return table
+
+def load_solved_table(k=3):
+    """Load the solved 3x3 table from disk, building and saving it on first use."""
+    # The keys are canonical Zobrist hashes, so a table saved by another version or with
+    # other hash keys would miss positions; it is then solved again
+    path = SOLVED_TABLE_FILE.format(k=k)
+    stamp = f"{SOLVED_TABLE_VERSION}-{ZobristHasher(3).fingerprint()}"
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get("stamp") == stamp:
+            return {int(key): value for key, value in data["table"].items()}
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    table = solve(3, k)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, "table": {str(key): value for key, value in table.items()}}, f)
+    except OSError:
+        pass  # Solving again next time is cheap enough
+    return table
+
+class TicTacToeAI:
+    def __init__(self, size=3, k=None, time_limit=1.0, seed=None):
+        """Create a computer player for a size x size board with k in a row."""
+        self.size = size
+        self.k = k or size
+        self.time_limit = time_limit
+        self.random = random.Random(seed)
+        self.hasher = ZobristHasher(size)
+        self.solved = load_solved_table(self.k) if size == 3 else None
+        # Line weights for the heuristic: a line with n marks and no opponent mark
+        self.weights = [0] + [10 ** i for i in range(1, self.k + 1)]
+        full = (1 << (size * size)) - 1
+        first_col = sum(1 << (row * size) for row in range(size))
+        self.full_mask = full
+        self.not_first_col = full & ~first_col
+        self.not_last_col = full & ~(first_col << (size - 1))
+        self.table = {}
+
+    def fork(self):
+        """Return a player sharing this one's precomputed tables but with its own search state."""
+        # Each search mutates the engine, hashes and transposition table, so a search
+        # running in another thread must not share them with this player
+        ai = copy.copy(self)
+        ai.hasher = copy.copy(self.hasher)
+        ai.hasher.hashes = [0] * 8
+        ai.random = random.Random(self.random.getrandbits(64))
+        ai.table = {}
+        return ai
+
+    def choose_move(self, engine):
+        """Return the (row, col) the computer plays for the engine's current player."""
+        if self.solved is not None:
+            cell = self.solved_move(engine)
+        else:
+            cell = self.search(engine.copy())
+        return divmod(cell, self.size)
+
+    def solved_move(self, engine):
+        """Pick a best move with one table lookup per free cell."""
+        # Every trial move is taken back, so the engine is left as it was
+        self.hasher.load(engine)
+        best_value = None
+        best_cells = []
+        for cell in engine.free_cells():
+            player = engine.current_player
+            engine.play(cell)
+            self.hasher.toggle(player, cell)
+            value = -self.solved[self.hasher.key()]
+            self.hasher.toggle(player, cell)
+            engine.undo(cell)
+            if best_value is None or value > best_value:
+                best_value = value
+                best_cells = [cell]
+            elif value == best_value:
+                best_cells.append(cell)
+        return self.random.choice(best_cells)
+
+    def search(self, engine):
+        """Iterative deepening alpha-beta search that stops at the time limit."""
+        self.engine = engine
+        self.hasher.load(engine)
+        self.eval = self.evaluate()
+        self.deadline = time.perf_counter() + self.time_limit
+        self.nodes = 0
+        self.table.clear()
+
+        moves = self.candidate_moves()
+        best_move = moves[0]
+        for depth in range(1, len(engine.free_cells()) + 1):
+            try:
+                score, move = self.root_search(depth, moves)
+            except SearchTimeout:
+                break
+            best_move = move
+            # Search the best move first at the next depth
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - self.size * self.size:
+                break  # The result is already forced
+        return best_move
+
+    def root_search(self, depth, moves):
+        alpha = -WIN_SCORE * 2
+        best_move = moves[0]
+        for cell in moves:
+            score = -self.negamax_move(cell, depth - 1, -WIN_SCORE * 2, -alpha, 1)
+            if score > alpha:
+                alpha = score
+                best_move = cell
+        return alpha, best_move
+
+    def negamax_move(self, cell, depth, alpha, beta, ply):
+        """Play a cell, search the reply, and take the move back."""
+        engine = self.engine
+        player = engine.current_player
+        delta = self.eval_delta(player, cell)
+        result = engine.play(cell)
+        self.hasher.toggle(player, cell)
+        self.eval += delta
+        try:
+            if result == "win":
+                return -(WIN_SCORE - ply)
+            if result == "tie":
+                return 0
+            return self.negamax(depth, alpha, beta, ply)
+        finally:
+            self.eval -= delta
+            self.hasher.toggle(player, cell)
+            engine.undo(cell)
+
+    def negamax(self, depth, alpha, beta, ply):
+        """Return the score for the player to move."""
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+        if depth == 0:
+            return self.eval if self.engine.current_player == "X" else -self.eval
+
+        key = self.hasher.key()
+        entry = self.table.get(key)
+        if entry and entry[0] >= depth:
+            _, score, flag = entry
+            if flag == EXACT:
+                return score
+            if flag == LOWER:
+                alpha = max(alpha, score)
+            elif flag == UPPER:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+        original_alpha = alpha
+        best = -WIN_SCORE * 2
+        for cell in self.candidate_moves():
+            score = -self.negamax_move(cell, depth - 1, -beta, -alpha, ply + 1)
+            if score > best:
+                best = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        flag = UPPER if best <= original_alpha else LOWER if best >= beta else EXACT
+        self.table[key] = (depth, best, flag)
+        return best
+
+    def line_value(self, x_count, o_count):
+        """Heuristic value of one line from X's point of view."""
+        if o_count == 0:
+            return self.weights[x_count]
+        if x_count == 0:
+            return -self.weights[o_count]
+        return 0
+
+    def evaluate(self):
+        """Score the whole board from X's point of view."""
+        x_counts = self.engine.line_counts["X"]
+        o_counts = self.engine.line_counts["O"]
+        return sum(self.line_value(x, o) for x, o in zip(x_counts, o_counts))
+
+    def eval_delta(self, player, cell):
+        """Change in the heuristic score when the player marks the cell."""
+        x_counts = self.engine.line_counts["X"]
+        o_counts = self.engine.line_counts["O"]
+        delta = 0
+        for line in self.engine.cell_lines[cell]:
+            x, o = x_counts[line], o_counts[line]
+            if player == "X":
+                delta += self.line_value(x + 1, o) - self.line_value(x, o)
+            else:
+                delta += self.line_value(x, o + 1) - self.line_value(x, o)
+        return delta
+
+    def candidate_moves(self):
+        """Return empty cells next to a mark, most promising first."""
+        occupied = self.engine.occupied
+        if not occupied:
+            return [(self.size // 2) * self.size + self.size // 2]
+        near = occupied | (occupied << 1) & self.not_first_col | (occupied >> 1) & self.not_last_col
+        near = (near | near << self.size | near >> self.size) & self.full_mask & ~occupied
+        cells = []
+        cell = 0
+        while near:
+            if near & 1:
+                cells.append(cell)
+            near >>= 1
+            cell += 1
+        # Cells that extend or block the longest open lines first
+        x_counts = self.engine.line_counts["X"]
+        o_counts = self.engine.line_counts["O"]
+        weights = self.weights
+
+        def priority(cell):
+            total = 0
+            for line in self.engine.cell_lines[cell]:
+                x, o = x_counts[line], o_counts[line]
+                if o == 0:
+                    total += weights[x]
+                if x == 0:
+                    total += weights[o]
+            return total
+
+        cells.sort(key=priority, reverse=True)
+        return cells
@@ -0,0 +1,140 @@
+from functools import lru_cache
+
+# Row and column steps for the four line directions
+LINE_DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+@lru_cache(maxsize=None)
+def build_lines(size, k):
+    """Return the bit mask, cell list and per-cell line list for every k-in-a-row line."""
+    line_masks = []
+    line_cells = []
+    cell_lines = [[] for _ in range(size * size)]
+    for row in range(size):
+        for col in range(size):
+            for dr, dc in LINE_DIRECTIONS:
+                end_row = row + dr * (k - 1)
+                end_col = col + dc * (k - 1)
+                if not (0 <= end_row < size and 0 <= end_col < size):
+                    continue
+                cells = tuple((row + dr * i) * size + col + dc * i for i in range(k))
+                mask = 0
+                for cell in cells:
+                    mask |= 1 << cell
+                    cell_lines[cell].append(len(line_masks))
+                line_masks.append(mask)
+                line_cells.append(cells)
+    return tuple(line_masks), tuple(line_cells), tuple(tuple(lines) for lines in cell_lines)
+
+class TicTacToeEngine:
+    def __init__(self, size=3, k=None):
+        """Initialize the Tic Tac Toe rules for a size x size board and k in a row."""
+        self.size = size
+        self.k = k or size
+        if not 1 <= self.k <= size:
+            raise ValueError("k must be between 1 and the board size")
+        self.full_mask = (1 << (size * size)) - 1
+        self.line_masks, self.line_cells, self.cell_lines = build_lines(size, self.k)
+        self.reset()
+
+    def reset(self):
+        """Clear the board for a new game."""
+        # One bit per cell for each player, bit index = row * size + col
+        self.bits = {"X": 0, "O": 0}
+        # Number of marks each player has on every line, updated move by move
+        self.line_counts = {"X": [0] * len(self.line_masks), "O": [0] * len(self.line_masks)}
+        self.current_player = "X"
+        self.winning_combo = []
+        self.winner = None
+        self.moves = 0
+
+    def copy(self):
+        """Return an independent copy of the game state."""
+        other = TicTacToeEngine.__new__(TicTacToeEngine)
+        other.__dict__.update(self.__dict__)
+        other.bits = dict(self.bits)
+        other.line_counts = {player: list(counts) for player, counts in self.line_counts.items()}
+        other.winning_combo = list(self.winning_combo)
+        return other
+
+    @property
+    def occupied(self):
+        """Return the bit mask of every played cell."""
+        return self.bits["X"] | self.bits["O"]
+
+    @property
+    def board(self):
+        """Return the board as rows of "X", "O" and "" strings."""
+        board = []
+        for row in range(self.size):
+            cells = []
+            for col in range(self.size):
+                bit = 1 << (row * self.size + col)
+                cells.append("X" if self.bits["X"] & bit else "O" if self.bits["O"] & bit else "")
+            board.append(cells)
+        return board
+
+    def is_free(self, row, col):
+        """Return True if the cell has not been played yet."""
+        return not self.occupied >> (row * self.size + col) & 1
+
+    def make_move(self, row, col):
+        """Play the current player's mark and return "win", "tie" or None."""
+        if not self.is_free(row, col):
+            raise ValueError("That spot is already taken!")
+        return self.play(row * self.size + col)
+
+    def play(self, cell):
+        """Play the current player's mark on a cell index and return "win", "tie" or None."""
+        player = self.current_player
+        self.bits[player] |= 1 << cell
+        self.moves += 1
+        counts = self.line_counts[player]
+        won_line = None
+        for line in self.cell_lines[cell]:
+            counts[line] += 1
+            if counts[line] == self.k:
+                won_line = line
+
+        if won_line is not None:
+            self.winner = player
+            self.winning_combo = [divmod(c, self.size) for c in self.line_cells[won_line]]
+            return "win"
+        if self.is_tie():
+            return "tie"
+        self.switch_player()
+        return None
+
+    def undo(self, cell):
+        """Take back the last move, which was played on the given cell."""
+        if self.winner is None and not self.is_tie():
+            self.switch_player()
+        player = self.current_player
+        self.bits[player] &= ~(1 << cell)
+        self.moves -= 1
+        counts = self.line_counts[player]
+        for line in self.cell_lines[cell]:
+            counts[line] -= 1
+        self.winner = None
+        self.winning_combo = []
+
+    def check_winner(self, row, col):
+        """Check if the current player has a full line through (row, col)."""
+        bits = self.bits[self.current_player]
+        for line in self.cell_lines[row * self.size + col]:
+            if bits & self.line_masks[line] == self.line_masks[line]:
+                self.winning_combo = [divmod(c, self.size) for c in self.line_cells[line]]
+                return True
+        return False
+
+    def is_tie(self):
+        """Check if the board is full."""
+        return self.occupied == self.full_mask
+
+    def free_cells(self):
+        """Return the indices of the empty cells."""
+        occupied = self.occupied
+        return [cell for cell in range(self.size * self.size) if not occupied >> cell & 1]
+
+    def switch_player(self):
+        """Switch the current player."""
+        self.current_player = "O" if self.current_player == "X" else "X"
@@ -0,0 +1,135 @@
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+from tictactoeai import TicTacToeAI, load_solved_table
+from tictactoeengine import TicTacToeEngine
+
+class RandomAgent:
+    def __init__(self, size, k, seed=None):
+        """Plays a random free cell."""
+        self.random = random.Random(seed)
+
+    def choose(self, engine):
+        return self.random.choice(engine.free_cells())
+
+class HeuristicAgent:
+    def __init__(self, size, k, seed=None):
+        """Wins or blocks when it can, otherwise plays the cell on the most open lines."""
+        self.random = random.Random(seed)
+        self.weights = [0] + [4 ** i for i in range(1, (k or size) + 1)]
+
+    def choose(self, engine):
+        player = engine.current_player
+        opponent = "O" if player == "X" else "X"
+        own = engine.line_counts[player]
+        other = engine.line_counts[opponent]
+        k = engine.k
+        best_cells = []
+        best_score = -1
+        for cell in engine.free_cells():
+            score = 0
+            for line in engine.cell_lines[cell]:
+                if other[line] == 0:
+                    if own[line] == k - 1:
+                        return cell  # Winning move
+                    score += self.weights[own[line]] + 1
+                if own[line] == 0:
+                    if other[line] == k - 1:
+                        score += 10 ** 9  # Block the opponent's winning move
+                    score += self.weights[other[line]]
+            if score > best_score:
+                best_score = score
+                best_cells = [cell]
+            elif score == best_score:
+                best_cells.append(cell)
+        return self.random.choice(best_cells)
+
+class PerfectAgent:
+    def __init__(self, size, k, seed=None, time_limit=0.05):
+        """Plays the solved move on 3x3, or the timed search move on larger boards."""
+        self.ai = TicTacToeAI(size, k, time_limit=time_limit, seed=seed)
+
+    def choose(self, engine):
+        row, col = self.ai.choose_move(engine)
+        return row * engine.size + col
+
+AGENTS = {"random": RandomAgent, "heuristic": HeuristicAgent, "perfect": PerfectAgent}
+
+def play_games(job):
+    """Play a batch of games in one process and return the outcome counts."""
+    x_agent, o_agent, size, k, games, seed = job
+    agents = {"X": AGENTS[x_agent](size, k, seed),
+              "O": AGENTS[o_agent](size, k, seed + 1 if seed is not None else None)}
+    engine = TicTacToeEngine(size, k)
+    counts = {"X": 0, "O": 0, "Ties": 0, "moves": 0}
+    for _ in range(games):
+        engine.reset()
+        while True:
+            result = engine.play(agents[engine.current_player].choose(engine))
+            if result == "win":
+                counts[engine.winner] += 1
+                break
+            if result == "tie":
+                counts["Ties"] += 1
+                break
+        counts["moves"] += engine.moves
+    return counts
+
+def simulate(games, x_agent="random", o_agent="random", size=3, k=None, workers=None, seed=None):
+    """Play games across a process pool and return win rates, game length and throughput."""
+    if games < 1:
+        raise ValueError("simulate needs at least one game")
+    workers = workers or os.cpu_count() or 1
+    if size == 3 and "perfect" in (x_agent, o_agent):
+        load_solved_table(k or size)  # Build the table once before the workers read it
+
+    # A few batches per worker keeps every core busy until the end
+    batches = min(games, workers * 4)
+    jobs = []
+    for i in range(batches):
+        batch_games = games // batches + (1 if i < games % batches else 0)
+        batch_seed = None if seed is None else seed + 2 * i
+        jobs.append((x_agent, o_agent, size, k, batch_games, batch_seed))
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = list(map(play_games, jobs))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(play_games, jobs, chunksize=1)
+    elapsed = time.perf_counter() - start
+
+    totals = {"X": 0, "O": 0, "Ties": 0, "moves": 0}
+    for counts in results:
+        for key, value in counts.items():
+            totals[key] += value
+    return {
+        "games": games,
+        "x_win_rate": totals["X"] / games,
+        "o_win_rate": totals["O"] / games,
+        "draw_rate": totals["Ties"] / games,
+        "mean_length": totals["moves"] / games,
+        "games_per_second": games / elapsed,
+        "seconds": elapsed,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tic Tac Toe self-play simulator")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--x", choices=sorted(AGENTS), default="random", help="agent playing X")
+    parser.add_argument("--o", choices=sorted(AGENTS), default="random", help="agent playing O")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--k", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    stats = simulate(args.games, args.x, args.o, args.size, args.k, args.workers, args.seed)
+    print(f"{stats['games']} games, {args.x} (X) vs {args.o} (O)")
+    print(f"X wins: {stats['x_win_rate']:.2%}  O wins: {stats['o_win_rate']:.2%}  "
+          f"Draws: {stats['draw_rate']:.2%}")
+    print(f"Mean game length: {stats['mean_length']:.2f} moves")
+    print(f"Throughput: {stats['games_per_second']:,.0f} games/sec in {stats['seconds']:.2f}s")